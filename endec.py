@@ -11,16 +11,27 @@ The executable reads:
 from __future__ import annotations
 
 import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
 import json
 import logging
 import os
 from pathlib import Path
+import queue
+import random
 import re
+import signal
 import stat
+import threading
 import time
-from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Sequence, cast
+from urllib.parse import parse_qs, urlparse
 
 # Ensures compatibility with both Python 3.7 (via backports.zoneinfo) and newer
 # versions
@@ -29,14 +40,37 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo  # type: ignore[import,no-redef]
 
-import pika
-from pika.exceptions import AMQPChannelError, AMQPConnectionError, UnroutableError
-import requests
-from serial import Serial
-from serial.serialutil import SerialException
+# Optional: google-re2 matches in linear time, which bounds the cost of
+# searching noisy serial input for EAS headers. Falls back to the stdlib.
+try:
+    import re2 as header_re_engine
+except ImportError:
+    header_re_engine = re
+
+# Optional: orjson serializes straight to bytes several times faster than the
+# stdlib json module, which is set up in `_dumps()` to emit the same compact
+# form, so consumers see equivalent JSON either way.
+try:
+    import orjson
+except ImportError:
+    HAVE_ORJSON = False
+else:
+    HAVE_ORJSON = True
 
+# pika, requests and pyserial are imported where they are used, so that e.g.
+# `--help` or a bad config exits without loading the network/serial stacks
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import pika
     from pika.adapters.blocking_connection import BlockingChannel
+    import requests
+    from serial import Serial
+
+    # Items handed to the RabbitMQ publisher thread: (payload, routing key), or
+    # None to ask the thread to exit. mypy checks an alias as a runtime
+    # expression, so it can't use `X | None` for Python < 3.10
+    RabbitQueue = queue.Queue[Optional[tuple[dict[str, Any], str]]]
 
 # ---------------------------------------------------------------------------
 # Utilities
@@ -45,6 +79,43 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger("wbor-endec")
 
 
+def _dumps(obj: Any) -> bytes:  # noqa: ANN401
+    """Serialize `obj` to compact UTF-8 encoded JSON, using orjson when available.
+
+    The stdlib fallback uses orjson's separators and leaves non-ASCII text
+    unescaped, so for our payloads (strings, ints and nested dicts/lists) both
+    produce the same bytes.
+
+    Args:
+        obj: The JSON-serializable object.
+
+    Returns:
+        The JSON document as bytes, ready to send on the wire.
+    """
+    if HAVE_ORJSON:
+        # orjson is untyped (Any) to mypy when it isn't installed
+        return cast("bytes", orjson.dumps(obj))
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Parse a JSON document, using orjson when available.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The parsed object.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON (orjson's error is a
+            subclass of it).
+    """
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _lazy_setup_logging(debug: bool, logfile: str | None) -> None:
     """Configure root logger.
 
@@ -87,6 +158,107 @@ def _lazy_setup_logging(debug: bool, logfile: str | None) -> None:
 # RabbitMQ Publisher
 # ---------------------------------------------------------------------------
 
+# Connection tuning applied unless the AMQP URL sets it in its query string.
+# Heartbeats let both sides notice a dead TCP connection, and pika retries the
+# initial connect itself before we fall back to our own retry logic.
+AMQP_CONNECTION_DEFAULTS: dict[str, int] = {
+    "heartbeat": 30,
+    "blocked_connection_timeout": 10,
+    "connection_attempts": 3,
+    "retry_delay": 2,
+}
+
+
+class SharedAMQPConnection:
+    """An AMQP connection shared by several publishers, each on its own channel.
+
+    Publishers in one process only need one connection between them, which
+    saves a socket, a handshake and a heartbeat stream per extra publisher.
+    Pika connections are not thread-safe, so publishers hold `lock` whenever
+    they use the connection or a channel on it. The connection is (re)opened on
+    demand and closed when the last publisher using it releases it, after which
+    it can't be reopened until a publisher acquires it again.
+    """
+
+    def __init__(self, amqp_url: str) -> None:
+        """Initialize the shared connection without connecting yet.
+
+        Args:
+            amqp_url: AMQP connection URL.
+        """
+        self.amqp_url = amqp_url
+        self.lock = threading.RLock()
+        self.connection: pika.BlockingConnection | None = None
+        self._users = 0
+        self.logger = logging.getLogger(__name__ + ".SharedAMQPConnection")
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the connection is currently open."""
+        return self.connection is not None and self.connection.is_open
+
+    def _connection_parameters(self) -> pika.URLParameters:
+        """Build connection parameters from the AMQP URL plus our defaults.
+
+        Returns:
+            The parameters, with `AMQP_CONNECTION_DEFAULTS` applied for any setting
+            the URL does not specify itself.
+        """
+        import pika
+
+        params = pika.URLParameters(self.amqp_url)
+        query = parse_qs(urlparse(self.amqp_url).query)
+        for name, value in AMQP_CONNECTION_DEFAULTS.items():
+            if name not in query:
+                setattr(params, name, value)
+        return params
+
+    def connect(self) -> pika.BlockingConnection:
+        """Return the open connection, connecting first if necessary.
+
+        Returns:
+            The open connection.
+
+        Raises:
+            ConnectionWrongStateError: If no publisher holds the connection, e.g.
+                a publisher thread that outlived shutdown tries to reconnect.
+        """
+        import pika
+        from pika.exceptions import ConnectionWrongStateError
+
+        with self.lock:
+            if self._users <= 0:
+                msg = "AMQP connection was released by all of its publishers"
+                raise ConnectionWrongStateError(msg)
+            if self.connection is None or not self.connection.is_open:
+                # Only strip the credentials from the URL if it will be logged
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Attempting to connect to RabbitMQ server at %s",
+                        self.amqp_url.rpartition("@")[2],
+                    )
+                self.connection = pika.BlockingConnection(self._connection_parameters())
+            return self.connection
+
+    def acquire(self) -> None:
+        """Register a publisher as a user of the connection."""
+        with self.lock:
+            self._users += 1
+
+    def release(self) -> None:
+        """Unregister a publisher, closing the connection after the last one."""
+        with self.lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            try:
+                if self.connection and self.connection.is_open:
+                    self.connection.close()
+                    self.logger.info("RabbitMQ connection closed.")
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.exception("Error closing RabbitMQ connection: %s", e)
+            self.connection = None
+
 
 class RabbitMQPublisher:
     """Publisher.
@@ -96,71 +268,105 @@ class RabbitMQPublisher:
     """
 
     def __init__(
-        self, amqp_url: str, exchange_name: str, exchange_type: str = "topic"
+        self,
+        amqp_url: str | None = None,
+        *,
+        exchange_name: str,
+        exchange_type: str = "topic",
+        connection: SharedAMQPConnection | None = None,
     ) -> None:
         """Initialize the RabbitMQ publisher.
 
         Args:
-            amqp_url: AMQP connection URL.
+            amqp_url: AMQP connection URL for a private connection. Not needed
+                with `connection`, whose URL is used instead.
             exchange_name: Name of the exchange to publish to.
             exchange_type: Type of exchange (default: topic).
+            connection: Connection shared with other publishers. A private one
+                is created for `amqp_url` if omitted.
+
+        Raises:
+            ValueError: If neither `amqp_url` nor `connection` is given, or they
+                point at different brokers.
         """
-        self.amqp_url = amqp_url
+        if connection is None:
+            if not amqp_url:
+                msg = "An AMQP URL or a shared connection is required"
+                raise ValueError(msg)
+            connection = SharedAMQPConnection(amqp_url)
+        elif amqp_url is not None and amqp_url != connection.amqp_url:
+            msg = "amqp_url does not match the shared connection's URL"
+            raise ValueError(msg)
+        self.amqp_url = connection.amqp_url
         self.exchange_name = exchange_name
         self.exchange_type = exchange_type
-        self._connection: pika.BlockingConnection | None = None
+        self._shared = connection
+        self._lock = self._shared.lock
         self._channel: BlockingChannel | None = None
+        # The exchange is durable, so it only needs declaring again after an error
+        self._exchange_declared = False
+        self._closed = False
         self.logger = logging.getLogger(__name__ + ".RabbitMQPublisher")
-        self._connect()
+        self._shared.acquire()
+        try:
+            self._connect()
+        except Exception:
+            # Don't keep the shared connection open on behalf of a failed publisher
+            self._shared.release()
+            raise
 
     def _connect(self) -> None:
-        """Handle connection to RabbitMQ server and channel declaration."""
-        if self._connection and self._connection.is_open:
-            # Already connected
-            return
-        try:
-            self.logger.debug(
-                "Attempting to connect to RabbitMQ server at %s",
-                self.amqp_url.split("@")[-1],
-            )
-            self._connection = pika.BlockingConnection(
-                pika.URLParameters(self.amqp_url)
-            )
-            self._channel = self._connection.channel()
-            self._channel.exchange_declare(
-                exchange=self.exchange_name,
-                exchange_type=self.exchange_type,
-                durable=True,
-            )
+        """Handle connection to RabbitMQ server and channel declaration.
 
-            # Enable publisher confirms, which allows us to confirm that
-            # messages have been successfully published to the exchange
-            # and not just simply sent to the RabbitMQ server.
-            # Note: Temporarily disable confirms to debug NACK issue
-            # self._channel.confirm_delivery()
-            self.logger.info(
-                "Successfully connected to RabbitMQ and ensured exchange `%s` "
-                "(type: %s)",
-                self.exchange_name,
-                self.exchange_type,
-            )
-        except AMQPConnectionError as e:
-            self.logger.critical("Failed to connect to RabbitMQ: %s", e)
-            self._connection = None
-            self._channel = None
-            raise
+        If only the channel was lost, a new channel is opened on the existing
+        (possibly shared) connection instead of paying for a new TCP/AMQP
+        handshake. The exchange is declared on the first connect, and again only
+        if an error since then may have been caused by it missing.
+
+        Raises:
+            ConnectionWrongStateError: If the publisher has been closed.
+        """
+        from pika.exceptions import AMQPConnectionError, ConnectionWrongStateError
+
+        with self._lock:
+            if self._closed:
+                msg = f"Publisher for exchange `{self.exchange_name}` is closed"
+                raise ConnectionWrongStateError(msg)
+            if self._shared.is_open and self._channel and self._channel.is_open:
+                # Already connected
+                return
+            try:
+                self._channel = self._shared.connect().channel()
+                if not self._exchange_declared:
+                    self._channel.exchange_declare(
+                        exchange=self.exchange_name,
+                        exchange_type=self.exchange_type,
+                        durable=True,
+                    )
+                    self._exchange_declared = True
+
+                # Enable publisher confirms, which allows us to confirm that
+                # messages have been successfully published to the exchange
+                # and not just simply sent to the RabbitMQ server.
+                # Note: Temporarily disable confirms to debug NACK issue
+                # self._channel.confirm_delivery()
+                self.logger.info(
+                    "Successfully connected to RabbitMQ and ensured exchange `%s` "
+                    "(type: %s)",
+                    self.exchange_name,
+                    self.exchange_type,
+                )
+            except AMQPConnectionError as e:
+                self.logger.critical("Failed to connect to RabbitMQ: %s", e)
+                self._channel = None
+                raise
 
     def _ensure_connected(self) -> None:
         """Check if the connection and channel are open.
 
         If not open, attempts to reconnect.
         """
-        if (
-            not self._connection
-            or self._connection.is_closed
-            or not self._channel
-            or self._channel.is_closed
-        ):
+        if not (self._shared.is_open and self._channel and self._channel.is_open):
             self.logger.warning(
                 "RabbitMQ connection/channel is closed or not established. "
                 "Reconnecting..."
@@ -171,140 +377,402 @@ class RabbitMQPublisher:
         """Public method to ensure RabbitMQ connection is active."""
         self._ensure_connected()
 
+    def process_data_events(self) -> None:
+        """Service the connection (e.g. heartbeats) without blocking.
+
+        Call this periodically while idle, so the broker doesn't drop an otherwise
+        healthy connection for missed heartbeats. Errors are logged and left for
+        the next `publish()` to recover from.
+        """
+        from pika.exceptions import AMQPChannelError, AMQPConnectionError
+
+        with self._lock:
+            connection = self._shared.connection
+            if not (connection and connection.is_open):
+                return
+            try:
+                connection.process_data_events(time_limit=0)
+            except (AMQPConnectionError, AMQPChannelError) as e:
+                self.logger.warning("RabbitMQ connection lost while idle: %s", e)
+
     def publish(
         self,
         message_body: dict[str, Any],
         routing_key: str,
         retry_attempts: int = 3,
         retry_delay_seconds: int = 5,
+        max_delay_seconds: int = 60,
+        *,
+        headers: dict[str, Any] | None = None,
     ) -> bool:
         """Publish a message to the RabbitMQ exchange with the specified routing key.
 
+        Failed attempts are retried with "full jitter" exponential backoff: before
+        retry `n` we sleep a random time between 0 and
+        `min(max_delay_seconds, retry_delay_seconds * 2**n)`, so publishers that
+        failed together (e.g. on a broker restart) don't retry in lockstep.
+
+        Only transient failures (connection/channel errors, socket errors and
+        NACKs) are retried. Bad payloads and unexpected errors fail immediately
+        rather than burning the retry budget on a permanent failure. If just the
+        channel was closed (e.g. by the broker) while the connection stayed up,
+        the retry opens a new channel on it immediately instead of backing off.
+
         Args:
             message_body: The message body to publish.
             routing_key: The routing key to use for the message.
             retry_attempts: Number of retry attempts on failure.
-            retry_delay_seconds: Delay between retry attempts in seconds.
+            retry_delay_seconds: Base delay between retry attempts in seconds.
+            max_delay_seconds: Upper bound on the delay between retry attempts.
+            headers: Optional AMQP message headers (routable via a headers
+                exchange, and readable without parsing the body).
 
         Returns:
             True if the message was published successfully, False otherwise.
         """
-        self._ensure_connected()
-        if (
-            not self._channel
-        ):  # Should not happen if _ensure_connected works, but as a safeguard
-            self.logger.error("Cannot publish, channel is not available.")
-            return False
+        import pika
+        from pika.exceptions import (
+            AMQPChannelError,
+            AMQPConnectionError,
+            UnroutableError,
+        )
 
-        message_body_str = json.dumps(message_body)
+        # Serialize once, outside the retry loop, straight to the bytes pika sends
+        try:
+            message_body_bytes = _dumps(message_body)
+        except (TypeError, ValueError):
+            self.logger.exception(
+                "Message for routing key `%s` is not JSON serializable; dropping it.",
+                routing_key,
+            )
+            return False
+        properties = pika.BasicProperties(
+            delivery_mode=2,  # 2 is persistent delivery mode
+            content_type="application/json",
+            headers=headers,
+        )
 
         for attempt in range(retry_attempts):
-            try:
-                # Try to publish the message
-                result = self._channel.basic_publish(
-                    exchange=self.exchange_name,
-                    routing_key=routing_key,
-                    body=message_body_str,
-                    properties=pika.BasicProperties(
-                        delivery_mode=2,  # 2 is persistent delivery mode
-                        content_type="application/json",
-                    ),
-                    mandatory=True,  # Important for unroutable messages
-                )
+            channel_lost = False
+            # Hold the lock per attempt, not while sleeping between attempts
+            with self._lock:
+                # e.g. closed at shutdown while this was backing off
+                if self._closed:
+                    self.logger.error(
+                        "Publisher is closed, dropping message with routing key `%s`.",
+                        routing_key,
+                    )
+                    return False
+                try:
+                    # Reconnects if a previous attempt lost the connection/channel
+                    self._ensure_connected()
+                    # Should not happen if _ensure_connected works, but as a safeguard
+                    if not self._channel:
+                        self.logger.error("Cannot publish, channel is not available.")
+                        return False
+
+                    # Try to publish the message
+                    result = self._channel.basic_publish(
+                        exchange=self.exchange_name,
+                        routing_key=routing_key,
+                        body=message_body_bytes,
+                        properties=properties,
+                        mandatory=True,  # Important for unroutable messages
+                    )
 
-                # If publisher confirms are disabled, basic_publish returns None
-                # If confirms are enabled, it returns True/False
-                if result is None or result is True:
-                    self.logger.info(
-                        "Successfully published message to "
-                        "exchange `%s` with routing key `%s`",
+                    # If publisher confirms are disabled, basic_publish returns None
+                    # If confirms are enabled, it returns True/False
+                    if result is None or result is True:
+                        self.logger.info(
+                            "Successfully published message to "
+                            "exchange `%s` with routing key `%s`",
+                            self.exchange_name,
+                            routing_key,
+                        )
+                        return True
+
+                    self.logger.warning(
+                        "Message to exchange `%s` with routing key `%s` was "
+                        "NACKed or not confirmed (attempt %d/%d).",
                         self.exchange_name,
                         routing_key,
+                        attempt + 1,
+                        retry_attempts,
+                    )
+                    # Handle NACK: could retry, log, or send to DLX.
+                except UnroutableError:
+                    self.logger.exception(
+                        "Message to exchange `%s` with routing key `%s` was "
+                        "unroutable. Ensure a queue is bound with this routing key "
+                        "or the exchange exists correctly.",
+                        self.exchange_name,
+                        routing_key,
+                    )
+                    return False  # Do not retry unroutable messages automatically
+                except (
+                    AMQPConnectionError,
+                    AMQPChannelError,
+                    OSError,  # Socket-level failures pika didn't wrap
+                ) as e:
+                    self.logger.exception(
+                        "Connection/Channel error during publish (attempt %d/%d): %s",
+                        attempt + 1,
+                        retry_attempts,
+                        e,
+                    )
+                    # A channel the broker closed can be replaced on the open
+                    # connection right away, without backing off. It may have
+                    # been closed because the exchange is gone, so redeclare it
+                    channel_lost = (
+                        isinstance(e, AMQPChannelError) and self._shared.is_open
                     )
-                    return True
+                    if isinstance(e, AMQPChannelError):
+                        self._exchange_declared = False
+                    # Fall through to retry or fail after attempts
+                except (TypeError, ValueError) as e:
+                    self.logger.exception(
+                        "Invalid message or publish arguments for routing key `%s`: %s",
+                        routing_key,
+                        e,
+                    )
+                    return False  # Retrying won't fix a programming/payload error
+                except Exception as e:  # pylint: disable=broad-except
+                    self.logger.exception(
+                        "An unexpected error occurred during publish "
+                        "(attempt %d/%d): %s",
+                        attempt + 1,
+                        retry_attempts,
+                        e,
+                    )
+                    return False  # Unknown failures aren't assumed to be transient
 
-                self.logger.warning(
-                    "Message to exchange `%s` with routing key `%s` was "
-                    "NACKed or not confirmed (attempt %d/%d).",
-                    self.exchange_name,
-                    routing_key,
-                    attempt + 1,
-                    retry_attempts,
-                )
-                # Handle NACK: could retry, log, or send to DLX.
-            except UnroutableError:
-                self.logger.exception(
-                    "Message to exchange `%s` with routing key `%s` was unroutable. "
-                    "Ensure a queue is bound with this routing key or the exchange "
-                    "exists correctly.",
-                    self.exchange_name,
-                    routing_key,
-                )
-                return False  # Do not retry unroutable messages automatically
+            if attempt == retry_attempts - 1:
+                break
+            if channel_lost:
+                self.logger.info("Retrying publish on a new channel...")
+                continue
+            delay = random.uniform(  # noqa: S311
+                0, min(max_delay_seconds, retry_delay_seconds * 2**attempt)
+            )
+            self.logger.info("Retrying publish in %.1f seconds...", delay)
+            time.sleep(delay)
+
+        self.logger.error(
+            "Failed to publish message to exchange `%s` with routing key `%s` "
+            "after %d attempts.",
+            self.exchange_name,
+            routing_key,
+            retry_attempts,
+        )
+        return False
+
+    def publish_many(self, messages: Sequence[tuple[dict[str, Any], str]]) -> int:
+        """Publish several messages back-to-back on the current channel.
+
+        The messages are written to the channel in a single pass instead of one
+        `publish()` call (and log line) each. Unlike `publish()`, nothing is
+        retried here: if (re)connecting or a write fails, the batch stops at that
+        message so the caller can back off once for the whole batch and resend
+        the rest, rather than each message spending its own retry budget.
+
+        Args:
+            messages: `(message_body, routing_key)` pairs to publish, in order.
+
+        Returns:
+            How many messages from the start of `messages` are done with, i.e.
+            published or dropped for not being JSON serializable. The rest were
+            not sent because of a connection or channel error.
+        """
+        if not messages:
+            return 0
+
+        import pika
+        from pika.exceptions import AMQPChannelError, AMQPConnectionError
+
+        properties = pika.BasicProperties(
+            delivery_mode=2,  # 2 is persistent delivery mode
+            content_type="application/json",
+        )
+        done = 0
+        with self._lock:
+            try:
+                # Reconnects if the connection/channel was lost since last time
+                self._ensure_connected()
+                channel = self._channel
+                if not channel:
+                    self.logger.error("Cannot publish, channel is not available.")
+                    return 0
+                for message_body, routing_key in messages:
+                    try:
+                        body = _dumps(message_body)
+                    except (TypeError, ValueError):
+                        self.logger.exception(
+                            "Message for routing key `%s` is not JSON serializable; "
+                            "dropping it.",
+                            routing_key,
+                        )
+                    else:
+                        channel.basic_publish(
+                            exchange=self.exchange_name,
+                            routing_key=routing_key,
+                            body=body,
+                            properties=properties,
+                            mandatory=True,
+                        )
+                    done += 1
             except (
                 AMQPConnectionError,
                 AMQPChannelError,
+                OSError,  # Socket-level failures pika didn't wrap
             ) as e:
-                self.logger.exception(
-                    "Connection/Channel error during publish (attempt %d/%d): %s",
-                    attempt + 1,
-                    retry_attempts,
+                self.logger.warning(
+                    "Batch publish interrupted after %d/%d messages: %s",
+                    done,
+                    len(messages),
                     e,
                 )
-                if attempt < retry_attempts - 1:
-                    time.sleep(
-                        retry_delay_seconds * (attempt + 1)
-                    )  # Exponential backoff might be better
-                    self.logger.info(
-                        "Retrying publish in %d seconds...", retry_delay_seconds
-                    )
-                    self._connect()  # Attempt to reconnect
-                else:
-                    self.logger.exception(
-                        "Failed to publish message after %d attempts.", retry_attempts
-                    )
-                    return False  # Indicate failure
+                # The channel may have been closed because the exchange is gone
+                if isinstance(e, AMQPChannelError):
+                    self._exchange_declared = False
+                return done
+
+        self.logger.info(
+            "Successfully published %d message(s) to exchange `%s`",
+            len(messages),
+            self.exchange_name,
+        )
+        return len(messages)
+
+    def close(self) -> None:
+        """Close the channel, and the connection if no other publisher uses it.
+
+        Calling this more than once has no further effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                if self._channel and self._channel.is_open:
+                    self._channel.close()
+                    self.logger.info("RabbitMQ channel closed.")
             except Exception as e:  # pylint: disable=broad-except
-                self.logger.exception(
-                    "An unexpected error occurred during publish (attempt %d/%d): %s",
-                    attempt + 1,
-                    retry_attempts,
-                    e,
-                )
-                # Fall through to retry or fail after attempts
+                self.logger.exception("Error closing RabbitMQ channel: %s", e)
+            self._channel = None
+            self._shared.release()
+
+
+# Upper bound on alerts waiting for the RabbitMQ publisher thread
+RABBIT_QUEUE_MAXSIZE = 256
+# Most messages the publisher thread sends in one `publish_many()` call
+RABBIT_BATCH_SIZE = 32
+# How often (seconds) an idle publisher thread services its connection
+RABBIT_IDLE_SECONDS = 10.0
+# Delay bounds (seconds) for the publisher thread's reconnection attempts
+RABBIT_RECONNECT_MIN_DELAY = 1.0
+RABBIT_RECONNECT_MAX_DELAY = 60.0
+# Most times the publisher thread tries a batch before dropping it
+RABBIT_BATCH_ATTEMPTS = 3
+
+
+def _rabbit_worker(publisher: RabbitMQPublisher, rabbit_queue: RabbitQueue) -> None:
+    """Publish queued messages to RabbitMQ until a `None` sentinel is received.
+
+    Runs on a dedicated thread so that the serial reader never blocks on the
+    network. The thread is the only user of `publisher`, since pika connections
+    are not thread-safe. Messages that pile up while a publish is in flight are
+    sent together in batches of up to `RABBIT_BATCH_SIZE`, and the connection's
+    heartbeats are serviced whenever the queue has been idle for a while.
+
+    Retries are handled here too: `publish_many()` stops at the first connection
+    error, and the thread backs off exponentially (with jitter) before sending
+    the unsent rest of the batch again, which reconnects. So a broker outage
+    costs neither the serial reader nor a tight reconnect loop. Messages still
+    unsent after `RABBIT_BATCH_ATTEMPTS` tries, or after one try while shutting
+    down, are dropped and each is logged.
 
-            if attempt < retry_attempts - 1:
-                self.logger.info(
-                    "Retrying publish in %d seconds...", retry_delay_seconds
-                )
-                time.sleep(retry_delay_seconds)
-            else:
-                self.logger.error(
-                    "Failed to publish message to exchange `%s` with routing key `%s` "
-                    "after %d attempts.",
-                    self.exchange_name,
-                    routing_key,
-                    retry_attempts,
+    Args:
+        publisher: The RabbitMQ publisher owned by this thread.
+        rabbit_queue: Queue of `(payload, routing_key)` items to publish.
+    """
+    backoff = RABBIT_RECONNECT_MIN_DELAY
+    while True:
+        try:
+            batch = [rabbit_queue.get(timeout=RABBIT_IDLE_SECONDS)]
+        except queue.Empty:
+            publisher.process_data_events()
+            continue
+        while batch[-1] is not None and len(batch) < RABBIT_BATCH_SIZE:
+            try:
+                batch.append(rabbit_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        messages = [item for item in batch if item is not None]
+        for attempt in range(1, RABBIT_BATCH_ATTEMPTS + 1):
+            try:
+                done = publisher.publish_many(messages)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Unexpected error in RabbitMQ publisher thread")
+                done = 0
+            messages = messages[done:]
+            if not messages:
+                backoff = RABBIT_RECONNECT_MIN_DELAY
+                break
+            # Give up after the last attempt, or right away if shutting down
+            if batch[-1] is None or attempt == RABBIT_BATCH_ATTEMPTS:
+                LOGGER.error(
+                    "Failed to publish %d message(s) to RabbitMQ after %d attempt(s).",
+                    len(messages),
+                    attempt,
                 )
-                return False
-        return False
+                _log_dropped_alerts(messages)
+                break
+            delay = backoff + random.random() * RABBIT_RECONNECT_MIN_DELAY  # noqa: S311
+            LOGGER.info(
+                "Retrying %d message(s) on a new RabbitMQ connection in %.1f "
+                "seconds...",
+                len(messages),
+                delay,
+            )
+            time.sleep(delay)
+            backoff = min(backoff * 2, RABBIT_RECONNECT_MAX_DELAY)
+
+        if batch[-1] is None:
+            return
 
-    def close(self) -> None:
-        """Close the RabbitMQ connection and channel."""
-        try:
-            if self._channel and self._channel.is_open:
-                self._channel.close()
-                self.logger.info("RabbitMQ channel closed.")
-        except Exception as e:  # pylint: disable=broad-except
-            self.logger.exception("Error closing RabbitMQ channel: %s", e)
-        try:
-            if self._connection and self._connection.is_open:
-                self._connection.close()
-                self.logger.info("RabbitMQ connection closed.")
-        except Exception as e:  # pylint: disable=broad-except
-            self.logger.exception("Error closing RabbitMQ connection: %s", e)
-        self._channel = None
-        self._connection = None
+
+def _log_dropped_alerts(messages: Sequence[tuple[dict[str, Any], str]]) -> None:
+    """Log each message the RabbitMQ publisher thread gave up on.
+
+    Args:
+        messages: The `(payload, routing_key)` pairs that were not published.
+    """
+    for payload, routing_key in messages:
+        LOGGER.error(
+            "Dropped RabbitMQ message for event `%s` (routing key `%s`).",
+            payload.get("eas_data", {}).get("event", "unknown"),
+            routing_key,
+        )
+
+
+def _stop_rabbit_worker(
+    rabbit_queue: RabbitQueue, rabbit_thread: threading.Thread
+) -> None:
+    """Ask the publisher thread to finish and wait (briefly) for it.
+
+    The thread publishes everything already queued before it exits, so this
+    must run before its publisher's connection is closed.
+
+    Args:
+        rabbit_queue: The queue feeding the publisher thread.
+        rabbit_thread: The publisher thread running `_rabbit_worker()`.
+    """
+    try:
+        rabbit_queue.put(None, timeout=5)
+    except queue.Full:
+        LOGGER.warning("RabbitMQ publish queue still full at shutdown.")
+    rabbit_thread.join(timeout=10)
 
 
 # ---------------------------------------------------------------------------
@@ -312,15 +780,25 @@ class RabbitMQPublisher:
 # ---------------------------------------------------------------------------
 
 
+# Seconds between health check pings (and between retries once failing)
+HEALTHCHECK_INTERVAL_SECONDS = 3600.0
+
+
 class HealthCheckManager:
     """Manages health check pings for the ENDEC system."""
 
     def __init__(self) -> None:
         """Initialize the health check manager."""
-        self.last_healthcheck_time: datetime | None = None
+        # time.monotonic() readings; wall-clock time is only needed on the wire
+        self.last_healthcheck_time: float | None = None
         self.healthcheck_failures = 0
         self.max_healthcheck_failures = 5
-        self.last_healthcheck_retry_time: datetime | None = None
+        self.last_healthcheck_retry_time: float | None = None
+        # Static health check metadata, sent as AMQP headers; built on first send
+        self._health_headers: dict[str, Any] | None = None
+        # Held while a ping is being sent, so the startup ping (sent from its own
+        # thread) and the serial loop's pings never overlap
+        self._send_lock = threading.Lock()
 
     def should_send_health_check(self) -> bool:
         """Check if it's time to send a health check without actually sending it.
@@ -328,21 +806,73 @@ class HealthCheckManager:
         Returns:
             True if a health check should be sent, False otherwise.
         """
-        current_time = datetime.now(timezone.utc)
+        current_time = time.monotonic()
 
         # If we've exceeded max failures, only retry every hour
         if self.healthcheck_failures >= self.max_healthcheck_failures:
             return (
                 self.last_healthcheck_retry_time is None
-                or current_time - self.last_healthcheck_retry_time >= timedelta(hours=1)
+                or current_time - self.last_healthcheck_retry_time
+                >= HEALTHCHECK_INTERVAL_SECONDS
             )
 
         # Send health check every hour (or during retry attempts)
-        return bool(
+        return (
             self.last_healthcheck_time is None
-            or current_time - self.last_healthcheck_time >= timedelta(hours=1)
+            or current_time - self.last_healthcheck_time >= HEALTHCHECK_INTERVAL_SECONDS
         )
 
+    def send_startup_health_check(
+        self,
+        healthcheck_publisher: RabbitMQPublisher | None,
+        routing_key: str,
+        port: str,
+    ) -> threading.Thread | None:
+        """Send the startup health check ping on a background thread.
+
+        A ping is always due at startup, so this skips should_send_health_check().
+        Sending it in the background lets serial reading start without waiting
+        on the broker; pings the serial loop tries meanwhile are skipped.
+
+        Args:
+            healthcheck_publisher: RabbitMQ publisher for health check messages.
+            routing_key: Routing key for health check messages.
+            port: Serial port being monitored.
+
+        Returns:
+            The thread sending the ping, or None if there is no publisher.
+        """
+        if not healthcheck_publisher:
+            return None
+
+        # Taken here rather than on the new thread, so no other ping can start
+        # before it does; released when the startup ping is done
+        self._send_lock.acquire()  # pylint: disable=consider-using-with
+        thread = threading.Thread(
+            target=self._send_startup_health_check,
+            args=(healthcheck_publisher, routing_key, port),
+            name="wbor-endec-startup-ping",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _send_startup_health_check(
+        self, healthcheck_publisher: RabbitMQPublisher, routing_key: str, port: str
+    ) -> None:
+        """Send the startup ping, then release the send lock taken for it.
+
+        Args:
+            healthcheck_publisher: RabbitMQ publisher for health check messages.
+            routing_key: Routing key for health check messages.
+            port: Serial port being monitored.
+        """
+        try:
+            self._publish_health_check(healthcheck_publisher, routing_key, port)
+            LOGGER.info("Startup health check ping sent")
+        finally:
+            self._send_lock.release()
+
     def send_health_check(
         self,
         healthcheck_publisher: RabbitMQPublisher | None,
@@ -352,7 +882,8 @@ class HealthCheckManager:
         """Send a health check message to RabbitMQ indicating the system is alive.
 
         This method should only be called after should_send_health_check() returns True.
-        Publishes a heartbeat message with current system status.
+        Publishes a heartbeat message with current system status. Does nothing if
+        another ping (e.g. the startup one) is still being sent.
 
         Args:
             healthcheck_publisher: RabbitMQ publisher for health check messages.
@@ -361,8 +892,27 @@ class HealthCheckManager:
         """
         if not healthcheck_publisher:
             return
+        if not self._send_lock.acquire(blocking=False):
+            LOGGER.debug("Health check already in progress; skipping this one.")
+            return
+        try:
+            self._publish_health_check(healthcheck_publisher, routing_key, port)
+        finally:
+            self._send_lock.release()
+
+    def _publish_health_check(
+        self, healthcheck_publisher: RabbitMQPublisher, routing_key: str, port: str
+    ) -> None:
+        """Publish one health check ping and update the failure bookkeeping.
 
-        current_time = datetime.now(timezone.utc)
+        The caller must hold the send lock.
+
+        Args:
+            healthcheck_publisher: RabbitMQ publisher for health check messages.
+            routing_key: Routing key for health check messages.
+            port: Serial port being monitored.
+        """
+        current_time = time.monotonic()
 
         # Update retry time if we were in failure state
         if self.healthcheck_failures >= self.max_healthcheck_failures:
@@ -372,20 +922,22 @@ class HealthCheckManager:
             )
             self.last_healthcheck_retry_time = current_time
 
+        # The static fields travel as headers, so the body carries only what
+        # changes per ping
+        headers = self._health_headers
+        if headers is None or headers["serial_port"] != port:
+            headers = self._health_headers = {
+                "source_application": "wbor-endec",
+                "event_type": "health_check",
+                "version": "4.1.1",
+                "serial_port": port,
+            }
         health_payload = {
-            "source_application": "wbor-endec",
-            "event_type": "health_check",
-            "timestamp_utc": current_time.isoformat(),
+            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
             "status": "alive",
-            "serial_port": port,
-            "system_info": {
-                "listening_port": port,
-                "application": "wbor-endec",
-                "version": "4.1.1",
-            },
         }
 
-        if healthcheck_publisher.publish(health_payload, routing_key):
+        if healthcheck_publisher.publish(health_payload, routing_key, headers=headers):
             self.last_healthcheck_time = current_time
 
             # If this was a successful retry after failures, log recovery
@@ -431,8 +983,7 @@ def _load_json(path: Path) -> dict[str, Any]:
     Returns:
         The contents of the JSON file as a dictionary.
     """
-    with path.open("r", encoding="utf-8") as fp:
-        return json.load(fp)  # type: ignore[no-any-return]
+    return _loads(path.read_bytes())  # type: ignore[no-any-return]
 
 
 def _validate_serial_port(path: str) -> str:
@@ -447,15 +998,22 @@ def _validate_serial_port(path: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If the path does not exist/not a character device.
     """
-    if not Path(path).exists():
+    try:
+        st = Path(path).stat()  # A single stat() answers both checks
+    except (FileNotFoundError, NotADirectoryError):
         msg = f"Serial port `{path}` not found"
-        raise argparse.ArgumentTypeError(msg)
-    if not stat.S_ISCHR(Path(path).stat().st_mode):
+        raise argparse.ArgumentTypeError(msg) from None
+    if not stat.S_ISCHR(st.st_mode):
         msg = f"`{path}` exists but is not a character device"
         raise argparse.ArgumentTypeError(msg)
     return path
 
 
+# URL schemes accepted in config; http(s) URLs must also name a host
+_ALLOWED_SCHEMES = frozenset({"http", "https", "amqp", "amqps"})
+_HTTP_SCHEMES = frozenset({"http", "https"})
+
+
 def _validate_url(u: str) -> str:
     """Validate that the given string is a valid URL.
 
@@ -468,10 +1026,14 @@ def _validate_url(u: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If the URL is invalid.
     """
-    p = urlparse(u)
-    if (p.scheme not in ("http", "https") or not p.netloc) and p.scheme not in (
-        "amqp",
-        "amqps",
+    # A plain split is all we need here; no need for a full urlparse()
+    scheme, sep, rest = u.partition("://")
+    scheme = scheme.lower()
+    if (
+        not sep
+        or scheme not in _ALLOWED_SCHEMES
+        # http(s) URL with no host
+        or (scheme in _HTTP_SCHEMES and (not rest or rest[0] in "/?#"))
     ):
         msg = f"Invalid URL: `{u!r}`"
         raise argparse.ArgumentTypeError(msg)
@@ -501,6 +1063,23 @@ def _validate_timezone(tz: str) -> str:
 class Settings:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """Runtime configuration merged from config + secrets."""
 
+    # Fixed set of settings, read on every alert; no per-instance `__dict__`
+    __slots__ = (
+        "all_destinations",
+        "debug",
+        "discord_urls",
+        "groupme_bot_ids",
+        "logfile",
+        "port",
+        "rabbitmq_amqp_url",
+        "rabbitmq_exchange_name",
+        "rabbitmq_healthcheck_exchange",
+        "rabbitmq_healthcheck_routing_key",
+        "rabbitmq_routing_key",
+        "timezone",
+        "webhooks",
+    )
+
     def __init__(self, public_cfg: dict[str, Any], secrets: dict[str, Any]) -> None:
         """Initialize the Settings object with public and secret configurations.
 
@@ -554,11 +1133,11 @@ class Settings:  # pylint: disable=too-few-public-methods, too-many-instance-att
             msg = "RabbitMQ AMQP URL provided but exchange name is missing."
             raise RuntimeError(msg)
 
+        # Every URL-addressed destination, validated above
+        self.all_destinations: tuple[str, ...] = (*self.webhooks, *self.discord_urls)
+
         if not (
-            self.webhooks
-            or self.groupme_bot_ids
-            or self.discord_urls
-            or self.rabbitmq_amqp_url
+            self.all_destinations or self.groupme_bot_ids or self.rabbitmq_amqp_url
         ):
             msg = (
                 "No destinations configured (webhooks, groupme, discord, or "
@@ -572,12 +1151,85 @@ class Settings:  # pylint: disable=too-few-public-methods, too-many-instance-att
 # ---------------------------------------------------------------------------
 
 
-def _load_location_map() -> tuple[dict[str, str], dict[str, str]]:
-    """Load information from the national_county.txt file and return two dictionaries.
+# SSCCC codes and name offsets need 32-bit items, but C only promises 16 bits
+# for the `unsigned int` behind typecode "I"
+COUNTY_ARRAY_TYPECODE = "I" if array("I").itemsize >= 4 else "L"  # noqa: PLR2004
+
+
+class _CountyTable:
+    """Read-only SSCCC -> "County, ST" lookup packed into flat arrays.
+
+    Keys are kept as a sorted array of integers and names as one concatenated
+    string with an offset table, rather than ~3000 separate dict entries.
+    """
+
+    __slots__ = ("_keys", "_names", "_offsets")
+
+    def __init__(self, keys: array[int], names: str, offsets: array[int]) -> None:
+        """Initialize the table from its packed parts.
+
+        Args:
+            keys: Sorted SSCCC codes as integers.
+            names: All location names concatenated in key order.
+            offsets: Start offset of each name in `names`, plus a final end offset.
+        """
+        self._keys = keys
+        self._names = names
+        self._offsets = offsets
+
+    @classmethod
+    def from_entries(cls, entries: dict[str, str]) -> _CountyTable:
+        """Pack a SSCCC -> name mapping into a table.
+
+        Args:
+            entries: Maps 5-digit SSCCC codes to human-readable names.
+
+        Returns:
+            The packed table.
+        """
+        codes = sorted(entries, key=int)
+        offsets = array(COUNTY_ARRAY_TYPECODE, [0])
+        for code in codes:
+            offsets.append(offsets[-1] + len(entries[code]))
+        return cls(
+            array(COUNTY_ARRAY_TYPECODE, map(int, codes)),
+            "".join(entries[code] for code in codes),
+            offsets,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of locations in the table."""
+        return len(self._keys)
+
+    def get(self, ssccc: str, default: str) -> str:
+        """Return the name for a SSCCC code, or `default` if it is unknown.
+
+        Args:
+            ssccc: The 5-digit state + county code.
+            default: The value to return if the code is not in the table.
+
+        Returns:
+            The human-readable location name, or `default`.
+        """
+        # int() alone would also take e.g. " 1001", "+1001" or "1_001"
+        if not (len(ssccc) == 5 and ssccc.isascii() and ssccc.isdigit()):  # noqa: PLR2004
+            return default
+        key = int(ssccc)
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return default
+        return self._names[self._offsets[i] : self._offsets[i + 1]]
+
+
+@lru_cache(maxsize=1)
+def _load_location_map() -> tuple[_CountyTable, dict[str, str]]:
+    """Load information from the national_county.txt file and return two lookups.
+
+    Loaded on first use rather than at import, then memoized.
 
     Returns:
         A tuple containing:
-        - loc_map: Maps PSSCCC location codes to human-readable names.
+        - loc_map: Maps SSCCC location codes to human-readable names.
         - state_map: Maps state FIPS codes to their corresponding abbreviations.
     """
     loc_map: dict[str, str] = {}
@@ -590,33 +1242,33 @@ def _load_location_map() -> tuple[dict[str, str], dict[str, str]]:
             "Location map file not found: %s. Location lookups will fail.",
             fn,
         )
-        return loc_map, state_map
-
-    with fn.open(encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split(",")
-
-            # Expect `ABBR,state_fips,county_fips,county_name,class`
-            if len(parts) < 4:  # noqa: PLR2004
-                # Malformed line, skip
-                continue
+        return _CountyTable.from_entries(loc_map), state_map
 
-            abbr, st, co, county_name = parts[:4]
+    # The file is plain unquoted ASCII, so split raw bytes and only decode the
+    # fields we keep rather than decoding every line up front
+    for line in fn.read_bytes().splitlines():
+        # Expect `ABBR,state_fips,county_fips,county_name,class`
+        row = line.split(b",", 4)
+        if len(row) < 4:  # noqa: PLR2004
+            # Malformed line, skip
+            continue
 
-            # Zero-fill state and county codes
-            st, co = st.zfill(2), co.zfill(3)
+        abbr, st, co, county_name = (field.decode() for field in row[:4])
 
-            key = st + co
-            loc_map[key] = f"{county_name}, {abbr}"
+        # Zero-fill state and county codes
+        st, co = st.zfill(2), co.zfill(3)
 
-            # If its the first time we see this state_fips, record abbr
-            state_map.setdefault(st, abbr)
-    return loc_map, state_map
+        key = st + co
+        loc_map[key] = f"{county_name}, {abbr}"
 
+        # If its the first time we see this state_fips, record abbr
+        state_map.setdefault(st, abbr)
 
-_LOC_MAP, _STATE_MAP = _load_location_map()
+    return _CountyTable.from_entries(loc_map), state_map
 
 
+# SAME codes repeat heavily between alerts (same counties every storm)
+@lru_cache(maxsize=4096)
 def _lookup_location(code: str) -> str:
     """Return a human-readable location name for the given PSSCCC code.
 
@@ -628,12 +1280,30 @@ def _lookup_location(code: str) -> str:
     """
     if not code or len(code) != 6:  # noqa: PLR2004
         return "Invalid Code"
+    loc_map, state_map = _load_location_map()
     ssccc = code[1:]  # Drop leading placeholder
     st, co = ssccc[:2], ssccc[2:]
     if co == "000":
-        return _STATE_MAP.get(st, "Unknown State")
+        return state_map.get(st, "Unknown State")
 
-    return _LOC_MAP.get(ssccc, "Unknown County/Area")
+    return loc_map.get(ssccc, "Unknown County/Area")
+
+
+@lru_cache(maxsize=2048)
+def _parse_locs(locs_raw: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a header's `-`-joined location field and name each code.
+
+    Alerts for the same area repeat the same location field, so the whole
+    result is cached.
+
+    Args:
+        locs_raw: The location codes from an EAS header, e.g. "023005-023031".
+
+    Returns:
+        The raw PSSCCC codes and their human-readable names, in header order.
+    """
+    raw_locs = tuple(locs_raw.split("-"))
+    return raw_locs, tuple(_lookup_location(loc) for loc in raw_locs)
 
 
 # ---------------------------------------------------------------------------
@@ -728,79 +1398,87 @@ EAS_EVENT_NAMES = {
 }
 
 # Define sets of event codes by category
-ADMIN_CODES = {"ADR", "DMO", "NPT", "NAT", "NIC", "NMN", "NST", "RWT", "RMT", "EAN"}
-WEATHER_CODES = {
-    "BZW",
-    "CFA",
-    "CFW",
-    "DSW",
-    "EWW",
-    "FFA",
-    "FFW",
-    "FFS",
-    "FLA",
-    "FLW",
-    "FLS",
-    "HWA",
-    "HWW",
-    "HUA",
-    "HUW",
-    "HLS",
-    "SVA",
-    "SVR",
-    "SVS",
-    "SQW",
-    "SMW",
-    "SPS",
-    "SSA",
-    "SSW",
-    "TOA",
-    "TOR",
-    "TRA",
-    "TRW",
-    "TSA",
-    "TSW",
-    "WSA",
-    "WSW",
-}
-NONWEATHER_CODES = {
-    "AVA",
-    "AVW",
-    "BLU",
-    "CAE",
-    "CDW",
-    "CEM",
-    "EQW",
-    "EVI",
-    "FRW",
-    "HMW",
-    "LEW",
-    "LAE",
-    "TOE",
-    "NUW",
-    "RHW",
-    "SPW",
-    "VOW",
-    "MEP",
-}
-INTERNAL_CODES = {"TXB", "TXF", "TXO", "TXP"}
-FUTURE_CODES = {
-    "BHW",
-    "BWW",
-    "CHW",
-    "CWW",
-    "DBA",
-    "DBW",
-    "DEW",
-    "EVA",
-    "FCW",
-    "IBW",
-    "IFW",
-    "LSW",
-    "POS",
-    "WFA",
-    "WFW",
-}
+ADMIN_CODES = frozenset(
+    {"ADR", "DMO", "NPT", "NAT", "NIC", "NMN", "NST", "RWT", "RMT", "EAN"}
+)
+WEATHER_CODES = frozenset(
+    {
+        "BZW",
+        "CFA",
+        "CFW",
+        "DSW",
+        "EWW",
+        "FFA",
+        "FFW",
+        "FFS",
+        "FLA",
+        "FLW",
+        "FLS",
+        "HWA",
+        "HWW",
+        "HUA",
+        "HUW",
+        "HLS",
+        "SVA",
+        "SVR",
+        "SVS",
+        "SQW",
+        "SMW",
+        "SPS",
+        "SSA",
+        "SSW",
+        "TOA",
+        "TOR",
+        "TRA",
+        "TRW",
+        "TSA",
+        "TSW",
+        "WSA",
+        "WSW",
+    }
+)
+NONWEATHER_CODES = frozenset(
+    {
+        "AVA",
+        "AVW",
+        "BLU",
+        "CAE",
+        "CDW",
+        "CEM",
+        "EQW",
+        "EVI",
+        "FRW",
+        "HMW",
+        "LEW",
+        "LAE",
+        "TOE",
+        "NUW",
+        "RHW",
+        "SPW",
+        "VOW",
+        "MEP",
+    }
+)
+INTERNAL_CODES = frozenset({"TXB", "TXF", "TXO", "TXP"})
+FUTURE_CODES = frozenset(
+    {
+        "BHW",
+        "BWW",
+        "CHW",
+        "CWW",
+        "DBA",
+        "DBW",
+        "DEW",
+        "EVA",
+        "FCW",
+        "IBW",
+        "IFW",
+        "LSW",
+        "POS",
+        "WFA",
+        "WFW",
+    }
+)
 
 CATEGORY_COLORS = {
     "administrative": 0x3498DB,  # blue
@@ -810,29 +1488,54 @@ CATEGORY_COLORS = {
     "future": 0xE74C3C,  # red
 }
 
-# EAS header regex, spec defined in parse_eas() docstring
-# HEADER_RE (strict, anchored)
-# HEADER_SEARCH_RE (not anchored)
-HEADER_RE = re.compile(
-    r"^ZCZC-"  # Start
-    r"(?P<org>[A-Z]{3})-"
-    r"(?P<event>[A-Z]{3})-"  # EEE
-    r"(?P<locs>(?:\d{6}-){0,30}\d{6})"  # 1-31 location codes
-    r"\+(?P<dur>\d{4})-"  # +TTTT
-    r"(?P<ts>\d{7})-"  # JJJHHMM
-    r"(?P<sender>[A-Za-z0-9/ ]{8})-$"  # LLLLLLLL-
+# Event code -> (name, category, Discord color), so everything we need to know
+# about an event is a single lookup
+EVENT_META: Mapping[str, tuple[str, str, int]] = MappingProxyType(
+    {
+        code: (
+            EAS_EVENT_NAMES.get(code, "Unknown"),
+            category,
+            CATEGORY_COLORS[category],
+        )
+        for category, codes in (
+            ("administrative", ADMIN_CODES),
+            ("weather", WEATHER_CODES),
+            ("emergency", NONWEATHER_CODES),
+            ("internal", INTERNAL_CODES),
+            ("future", FUTURE_CODES),
+        )
+        for code in codes
+    }
 )
+# Unknown codes are treated as emergencies
+UNKNOWN_EVENT_META = ("Unknown", "emergency", CATEGORY_COLORS["emergency"])
+
+# Originator code -> human-readable name
+ORG_NAMES = {
+    "EAS": "Emergency Alert System",
+    "CIV": "Civil Authorities",
+    "WXR": "National Weather Service",
+    "PEP": "Primary Entry Point (National)",
+}
 
-HEADER_SEARCH_RE = re.compile(
+# EAS header regex, spec defined in parse_eas() docstring
+# HEADER_SEARCH_RE (not anchored, compiled with re2 when available)
+# Digits are spelled `[0-9]` rather than `\d` so neither engine takes a
+# Unicode-aware class path (re2 does not accept `re` flags such as re.ASCII)
+HEADER_SEARCH_RE = header_re_engine.compile(
     r"ZCZC-"  # Start
     r"(?P<org>[A-Z]{3})-"
     r"(?P<event>[A-Z]{3})-"  # EEE
-    r"(?P<locs>(?:\d{6}-){0,30}\d{6})"  # 1-31 location codes
-    r"\+(?P<dur>\d{4})-"  # +TTTT
-    r"(?P<ts>\d{7})-"  # JJJHHMM
+    r"(?P<locs>(?:[0-9]{6}-){0,30}[0-9]{6})"  # 1-31 location codes
+    r"\+(?P<dur>[0-9]{4})-"  # +TTTT
+    r"(?P<ts>[0-9]{7})-"  # JJJHHMM
     r"(?P<sender>[A-Za-z0-9/ ]{8})-"  # LLLLLLLL-
 )
 
+# Bytes twin of the above, for finding headers in raw serial input before any
+# of it is decoded (headers are pure ASCII)
+HEADER_SEARCH_RE_B = header_re_engine.compile(HEADER_SEARCH_RE.pattern.encode("ascii"))
+
 
 def parse_eas(header: str, user_timezone: str = "America/New_York") -> dict[str, Any]:
     """Parse the EAS header and return a dictionary with the parsed fields.
@@ -886,60 +1589,51 @@ def parse_eas(header: str, user_timezone: str = "America/New_York") -> dict[str,
         msg = "Malformed EAS header"
         raise ValueError(msg)
 
-    g = m.groupdict()
+    # One tuple unpack instead of a name lookup per group; the order follows
+    # the named groups in HEADER_SEARCH_RE
+    org, event, locs_raw, dur, ts, sender_raw = m.groups()
 
     # Duration to minutes
-    hours, mins = divmod(int(g["dur"]), 100)
+    hours, mins = divmod(int(dur), 100)
     duration_minutes = hours * 60 + mins
 
     # Clean up space-padded sender
-    sender = g["sender"].rstrip()
+    sender = sender_raw.rstrip()
 
     # Get a human readable sender name equivalent
-    org_human = {
-        "EAS": "Emergency Alert System",
-        "CIV": "Civil Authorities",
-        "WXR": "National Weather Service",
-        "PEP": "Primary Entry Point (National)",
-    }.get(g["org"], g["org"])
+    org_human = ORG_NAMES.get(org, org)
 
     # JJJHHMM to ISO UTC (current year)
-    jjj, hh, mm = int(g["ts"][:3]), int(g["ts"][3:5]), int(g["ts"][5:])
-
-    now_utc_aware = datetime.now(timezone.utc)
-    year = now_utc_aware.year
+    jjj, hh, mm = int(ts[:3]), int(ts[3:5]), int(ts[5:])
 
-    y_start = datetime(year, 1, 1, tzinfo=timezone.utc)
-    start_utc = (y_start + timedelta(days=jjj - 1, hours=hh, minutes=mm)).strftime(
-        "%Y-%m-%dT%H:%MZ"
+    year = datetime.now(timezone.utc).year
+    start_dt_utc = datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(
+        days=jjj - 1, hours=hh, minutes=mm
     )
+    start_utc = start_dt_utc.strftime("%Y-%m-%dT%H:%MZ")
 
-    timestamp_local = (
-        (
-            datetime(year, 1, 1, tzinfo=timezone.utc)
-            + timedelta(days=jjj - 1, hours=hh, minutes=mm)
-        )
-        .astimezone(ZoneInfo(user_timezone))
-        .isoformat(timespec="minutes")
+    # ZoneInfo() returns a cached instance per key, so this doesn't re-read tzdata
+    timestamp_local = start_dt_utc.astimezone(ZoneInfo(user_timezone)).isoformat(
+        timespec="minutes"
     )
 
-    # Get human-readable location names, stored alongside the raw codes
-    raw_locs = g["locs"].split("-")
-    locs = [_lookup_location(loc) for loc in raw_locs]
+    # Get human-readable location names, stored alongside the raw codes. The
+    # cached tuples are copied into fresh lists so callers can't mutate them
+    raw_locs, locs = _parse_locs(locs_raw)
 
     return {
-        "org_raw": g["org"],
+        "org_raw": org,
         "org": org_human,
-        "event": g["event"],
-        "locs": locs,  # Human-readable location names
-        "raw_locs": raw_locs,  # Raw location codes
+        "event": event,
+        "locs": list(locs),  # Human-readable location names
+        "raw_locs": list(raw_locs),  # Raw location codes
         "duration_minutes": duration_minutes,
-        "duration_raw": g["dur"],
+        "duration_raw": dur,
         "start_utc": start_utc,
-        "timestamp_raw": g["ts"],
+        "timestamp_raw": ts,
         "timestamp_local": timestamp_local,
         "sender": sender,
-        "event_name": EAS_EVENT_NAMES.get(g["event"], "Unknown"),
+        "event_name": EVENT_META.get(event, UNKNOWN_EVENT_META)[0],
         "raw_header": header,
     }
 
@@ -948,6 +1642,63 @@ def parse_eas(header: str, user_timezone: str = "America/New_York") -> dict[str,
 # Destinations
 # ---------------------------------------------------------------------------
 
+# Keep-alive pool sizing for the shared HTTP session: hosts kept pooled, and
+# connections kept per host
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 16
+# Longest dispatch() waits for an alert's webhook POSTs before returning to
+# the serial port (stragglers keep running in the background)
+DISPATCH_TIMEOUT_SECONDS = 60.0
+
+# Runs webhook POSTs concurrently, so an alert takes as long as the slowest
+# destination rather than the sum of all of them. One worker per pooled
+# connection; threads are only started as work arrives.
+_DISPATCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="wbor-endec-dispatch"
+)
+
+# Sent with every webhook POST; set once on the session
+HTTP_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "WBOR-91-1-FM/wbor-endec",
+}
+
+
+def _build_http_session() -> requests.Session:
+    """Build the HTTP session shared by every webhook destination.
+
+    urllib3 pools connections per host, so alerts to the same Discord/GroupMe/
+    webhook host reuse one keep-alive TLS connection instead of a new handshake
+    each time.
+
+    Returns:
+        A `requests.Session` with retrying, pooled adapters mounted.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Discord and GroupMe rate-limit with 429 + Retry-After, so let urllib3
+    # retry those (and transient 5xx) after the server-requested delay
+    retry = Retry(
+        total=5,
+        backoff_factor=0.25,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Leave the final status to raise_for_status()
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class Webhook:  # pylint: disable=too-few-public-methods
     """Generic webhook POST client.
@@ -955,17 +1706,17 @@ class Webhook:  # pylint: disable=too-few-public-methods
     This class is used to send POST requests to a specified webhook URL.
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, session: requests.Session | None = None) -> None:
         """Initialize the Webhook object with the specified URL.
 
         Args:
             url: The webhook URL to send POST requests to.
+            session: HTTP session to send through. Pass the shared session so
+                connections are pooled across destinations; a private one is
+                built if omitted.
         """
         self.url = url
-        self.headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "WBOR-91-1-FM/wbor-endec",
-        }
+        self._session = session if session is not None else _build_http_session()
 
     def post(self, payload: dict[str, Any]) -> None:
         """Send a POST request to the webhook URL with the given payload.
@@ -976,11 +1727,13 @@ class Webhook:  # pylint: disable=too-few-public-methods
         Raises:
             requests.RequestException: If the POST request fails.
         """
+        import requests
+
         LOGGER.info("POST to `%s`", self.url)
+        # The session already sends `Content-Type: application/json`
+        body = _dumps(payload)
         try:
-            resp = requests.post(
-                self.url, headers=self.headers, json=payload, timeout=10
-            )
+            resp = self._session.post(self.url, data=body, timeout=10)
             resp.raise_for_status()
             LOGGER.debug(
                 "Webhook POST to `%s` successful, status %s", self.url, resp.status_code
@@ -989,133 +1742,153 @@ class Webhook:  # pylint: disable=too-few-public-methods
             LOGGER.warning("Webhook POST to `%s` failed: %s", self.url, exc)
 
 
+# Discord embed field names and inline flags, in the order their values are built
+DISCORD_EMBED_FIELDS: tuple[tuple[str, bool], ...] = (
+    ("Event", True),
+    ("Duration (min)", True),
+    ("Start (UTC)", True),
+    ("Sender", True),  # Sending station's ID
+    ("Originator", True),
+    ("Start (Local)", True),
+    ("Locations", False),  # Best on its own line if long
+    ("Raw Header", False),
+)
+
+
 class Discord:  # pylint: disable=too-few-public-methods
     """Discord webhook client."""
 
-    def __init__(self, urls: list[str]) -> None:
+    def __init__(
+        self, urls: list[str], session: requests.Session | None = None
+    ) -> None:
         """Initialize the Discord object with a list of webhook URLs.
 
         Args:
             urls: A list of Discord webhook URLs to send messages to.
+            session: HTTP session shared by the webhook clients.
         """
         self.urls = urls
-        self.webhook_clients = [Webhook(url) for url in urls]
+        if session is None:
+            session = _build_http_session()
+        self.webhook_clients = [Webhook(url, session) for url in urls]
 
-    def post(self, content: str, eas_fields: dict[str, Any]) -> None:
+    def post(
+        self, content: str, eas_fields: dict[str, Any], now_iso: str | None = None
+    ) -> list[Future[None]]:
         """Send a message to Discord with the given content and EAS fields.
 
+        Each webhook URL is posted to concurrently on the dispatch executor.
+
         Args:
             content: The message content to send.
             eas_fields: A dictionary containing EAS fields to include in the message as
                 embedded fields.
+            now_iso: UTC ISO timestamp for the embed, so it matches the other
+                destinations. Defaults to the current time.
+
+        Returns:
+            One future per webhook URL, resolved when its POST finishes.
         """
-        # Determine color based on event code
-        code = eas_fields.get("event", "")
-        if code in ADMIN_CODES:
-            cat = "administrative"
-        elif code in WEATHER_CODES:
-            cat = "weather"
-        elif code in NONWEATHER_CODES:
-            cat = "emergency"
-        elif code in INTERNAL_CODES:
-            cat = "internal"
-        elif code in FUTURE_CODES:
-            cat = "future"
-        else:
-            cat = "emergency"  # Default for unknown codes
-        color = CATEGORY_COLORS.get(cat, CATEGORY_COLORS["emergency"])
+        get = eas_fields.get
+        code = get("event", "Not found")
+        event_name = get("event_name")
 
+        # Determine color based on event code
+        color = EVENT_META.get(code, UNKNOWN_EVENT_META)[2]
+
+        values = (
+            f"{'Not found' if event_name is None else event_name} ({code})",
+            str(get("duration_minutes", "Not found")),
+            get("start_utc", "Not found"),
+            get("sender", "Not found"),
+            f"{get('org', 'Not found')} ({get('org_raw', 'Not found')})",
+            get("timestamp_local", "Not found"),
+            ", ".join(get("locs", [])) or "Not found",
+            f"```{get('raw_header', 'Not found')}```",
+        )
         embed_fields = [
-            # Event name
-            {
-                "name": "Event",
-                "value": (
-                    f"{eas_fields.get('event_name', 'Not found')} "
-                    f"({eas_fields.get('event', 'Not found')})"
-                ),
-                "inline": True,
-            },
-            # Duration in minutes
-            {
-                "name": "Duration (min)",
-                "value": str(eas_fields.get("duration_minutes", "Not found")),
-                "inline": True,
-            },
-            # Start timestamp in UTC
-            {
-                "name": "Start (UTC)",
-                "value": eas_fields.get("start_utc", "Not found"),
-                "inline": True,
-            },
-            # Sending station's ID
-            {
-                "name": "Sender",
-                "value": eas_fields.get("sender", "Not found"),
-                "inline": True,
-            },
-            # Originator
-            {
-                "name": "Originator",
-                "value": (
-                    f"{eas_fields.get('org', 'Not found')} "
-                    f"({eas_fields.get('org_raw', 'Not found')})"
-                ),
-                "inline": True,
-            },
-            # Timestamp Raw
-            {
-                "name": "Start (Local)",
-                "value": eas_fields.get("timestamp_local", "Not found"),
-                "inline": True,
-            },
-            # All location codes
-            {
-                "name": "Locations",
-                "value": ", ".join(eas_fields.get("locs", [])) or "Not found",
-                "inline": False,  # Best on its own line if long
-            },
-            {
-                "name": "Raw Header",
-                "value": f"```{eas_fields.get('raw_header', 'Not found')}```",
-                "inline": False,
-            },
+            {"name": name, "value": value, "inline": inline}
+            for (name, inline), value in zip(DISCORD_EMBED_FIELDS, values)
         ]
 
         embed = {
-            "title": f"EAS Alert: {eas_fields.get('event_name', 'Unknown Event')}",
+            "title": (
+                f"EAS Alert: {'Unknown Event' if event_name is None else event_name}"
+            ),
             "description": content if content else "See details in fields.",
             "color": color,
             "fields": embed_fields,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso or datetime.now(timezone.utc).isoformat(),
             "footer": {"text": "Powered by WBOR-91-1-FM/wbor-endec"},
         }
         payload = {"embeds": [embed], "username": "WBOR ENDEC Alerter"}
 
-        for client in self.webhook_clients:
-            client.post(payload)
+        return [
+            _DISPATCH_EXECUTOR.submit(client.post, payload)
+            for client in self.webhook_clients
+        ]
+
+
+def _text_segments(text: str, max_len: int) -> Iterator[str]:
+    """Yield `text` in pieces of at most `max_len` characters.
+
+    A piece ends at the last paragraph break (blank line) in the second half of
+    the window, so fields aren't cut mid-line without sending lots of tiny
+    pieces; otherwise it is cut at exactly `max_len`.
+
+    Args:
+        text: The text to split.
+        max_len: The longest piece to yield.
+
+    Yields:
+        Consecutive pieces of `text`, without the paragraph breaks cut at.
+    """
+    start = 0
+    while len(text) - start > max_len:
+        cut = text.rfind("\n\n", start + max_len // 2, start + max_len)
+        if cut == -1:
+            yield text[start : start + max_len]
+            start += max_len
+        else:
+            yield text[start:cut]
+            start = cut + 2
+    if start < len(text):
+        yield text[start:]
 
 
 class GroupMe:  # pylint: disable=too-few-public-methods
     """GroupMe bot client."""
 
-    def __init__(self, bot_ids: list[str]) -> None:
+    # Longest text sent per bot post (GroupMe allows 1000; leave some room)
+    MAX_SEGMENT_LEN = 450
+
+    def __init__(
+        self, bot_ids: list[str], session: requests.Session | None = None
+    ) -> None:
         """Initialize the GroupMe object with a list of bot IDs.
 
         Args:
             bot_ids: A list of GroupMe bot IDs to send messages to.
+            session: HTTP session for the bot API client.
         """
         self.bot_ids = bot_ids
         self.url = "https://api.groupme.com/v3/bots/post"
-        self.webhook_client = Webhook(self.url)
+        self.webhook_client = Webhook(self.url, session)
 
     def post(  # pylint: disable=too-many-locals
         self, message: str, eas_fields: dict[str, Any]
-    ) -> None:
+    ) -> list[Future[None]]:
         """Send a message to GroupMe with the given content via a Bot ID.
 
+        Bots are posted to concurrently on the dispatch executor; each bot's
+        segments are sent in order by a single task.
+
         Args:
             message: The message content to send.
             eas_fields: A dictionary containing EAS fields to include in the message.
+
+        Returns:
+            One future per bot ID, resolved when all of its segments are sent.
         """
         event_name = eas_fields.get("event_name", "Unknown Event")
         locs_str = ", ".join(eas_fields.get("locs", [])) or "Not found"
@@ -1136,18 +1909,27 @@ class GroupMe:  # pylint: disable=too-few-public-methods
         )
         body = f"{full_message}{footer}"
 
-        # Split body into 500 character segments (max GroupMe length)
-        max_len = 450  # Leave some room
-        segments = [body[i : i + max_len] for i in range(0, len(body), max_len)]
+        return [
+            _DISPATCH_EXECUTOR.submit(self._post_segments, bot_id, body)
+            for bot_id in self.bot_ids
+        ]
+
+    def _post_segments(self, bot_id: str, body: str) -> None:
+        """Post a message through one bot, split into segments sent in order.
 
-        # Iterate directly over the text_chunk in segments
-        for text_chunk in segments:
-            for bot_id in self.bot_ids:
-                payload = {
-                    "bot_id": bot_id,
-                    "text": text_chunk,
-                }
-                self.webhook_client.post(payload)
+        Segments are produced lazily, so the first is posted without waiting
+        for the whole message to be split.
+
+        Args:
+            bot_id: The GroupMe bot ID to post as.
+            body: The full message text.
+        """
+        for text_chunk in _text_segments(body, self.MAX_SEGMENT_LEN):
+            payload = {
+                "bot_id": bot_id,
+                "text": text_chunk,
+            }
+            self.webhook_client.post(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -1159,7 +1941,11 @@ def dispatch(
     msg: str,
     eas_fields: dict[str, Any],
     cfg: Settings,
-    rabbitmq_publisher: RabbitMQPublisher | None = None,
+    rabbit_queue: RabbitQueue | None = None,
+    *,
+    webhook_clients: list[Webhook] | None = None,
+    discord_client: Discord | None = None,
+    groupme_client: GroupMe | None = None,
 ) -> None:
     """Dispatch the message to the configured destinations.
 
@@ -1167,245 +1953,261 @@ def dispatch(
         msg: The message content to send.
         eas_fields: A dictionary containing EAS fields to include in the message.
         cfg: The runtime configuration object containing destination information.
-        rabbitmq_publisher: Instance for RabbitMQ.
+        rabbit_queue: Queue feeding the RabbitMQ publisher thread.
+        webhook_clients: Long-lived clients for the generic webhook URLs.
+        discord_client: Long-lived Discord client, if Discord is configured.
+        groupme_client: Long-lived GroupMe client, if GroupMe is configured.
     """
-    processed_timestamp_utc: str | None = None
+    # One processing timestamp shared by every destination, so they agree
+    processed_timestamp_utc = datetime.now(timezone.utc).isoformat()
+    # Webhook POSTs run concurrently; we wait for them all at the end
+    http_posts: list[Future[None]] = []
 
     # Generic Webhooks
-    if cfg.webhooks:
+    if webhook_clients:
         # Send the raw message and full EAS fields separately
         webhook_payload = {"message_text": msg, "eas_data": eas_fields}
-        for url in cfg.webhooks:
-            Webhook(url).post(webhook_payload)
+        http_posts.extend(
+            _DISPATCH_EXECUTOR.submit(client.post, webhook_payload)
+            for client in webhook_clients
+        )
+
+    # Discord and GroupMe share one fallback if there are no `eas_fields`
+    chat_msg, chat_fields = msg, eas_fields
+    if not eas_fields:
+        chat_msg, chat_fields = f"Plain message: {msg}", {"event_name": "Unknown Event"}
 
     # Discord
-    if cfg.discord_urls and eas_fields:
-        Discord(cfg.discord_urls).post(msg, eas_fields)
-    elif cfg.discord_urls:  # Fallback if no `eas_fields`
-        LOGGER.warning("No EAS fields, sending plain message to Discord URLs.")
-        Discord(cfg.discord_urls).post(
-            f"Plain message: {msg}", {"event_name": "Unknown Event"}
+    if discord_client:
+        if not eas_fields:
+            LOGGER.warning("No EAS fields, sending plain message to Discord URLs.")
+        http_posts.extend(
+            discord_client.post(chat_msg, chat_fields, processed_timestamp_utc)
         )
 
     # GroupMe
-    if cfg.groupme_bot_ids and eas_fields:
-        GroupMe(cfg.groupme_bot_ids).post(msg, eas_fields)
-    elif cfg.groupme_bot_ids:  # Fallback if no `eas_fields`
-        LOGGER.warning("No EAS fields, sending plain message to GroupMe bot IDs.")
-        GroupMe(cfg.groupme_bot_ids).post(
-            f"Plain message: {msg}", {"event_name": "Unknown Event"}
-        )
+    if groupme_client:
+        if not eas_fields:
+            LOGGER.warning("No EAS fields, sending plain message to GroupMe bot IDs.")
+        http_posts.extend(groupme_client.post(chat_msg, chat_fields))
 
     # RabbitMQ
-    if rabbitmq_publisher and cfg.rabbitmq_amqp_url and eas_fields:
+    if rabbit_queue is not None and cfg.rabbitmq_amqp_url:
+        if eas_fields:
+            eas_data = eas_fields
+        else:
+            LOGGER.warning("No EAS fields, publishing simplified message to RabbitMQ.")
+            eas_data = {"event_name": "Plain Text Message", "raw_header": "Not found"}
         LOGGER.debug(
-            "Publishing to RabbitMQ exchange `%s` with routing key `%s`",
+            "Queueing for RabbitMQ exchange `%s` with routing key `%s`",
             cfg.rabbitmq_exchange_name,
             cfg.rabbitmq_routing_key,
         )
 
-        processed_timestamp_utc = datetime.now(timezone.utc).isoformat()
-
         rabbitmq_payload = {
             "source": "wbor-endec",
             "timestamp_processed_utc": processed_timestamp_utc,
             "message_text": msg,
-            "eas_data": eas_fields,
+            "eas_data": eas_data,
         }
-        if not rabbitmq_publisher.publish(rabbitmq_payload, cfg.rabbitmq_routing_key):
-            LOGGER.error("Failed to publish message to RabbitMQ.")
-    elif rabbitmq_publisher and cfg.rabbitmq_amqp_url and not eas_fields:
-        LOGGER.warning("No EAS fields, publishing simplified message to RabbitMQ.")
-        processed_timestamp_utc = datetime.now(timezone.utc).isoformat()
-        rabbitmq_payload = {
-            "source": "wbor-endec",
-            "timestamp_processed_utc": processed_timestamp_utc,
-            "message_text": msg,
-            "eas_data": {"event_name": "Plain Text Message", "raw_header": "Not found"},
-        }
-        rabbitmq_publisher.publish(rabbitmq_payload, cfg.rabbitmq_routing_key)
+        _enqueue_rabbit(rabbit_queue, rabbitmq_payload, cfg.rabbitmq_routing_key)
+
+    if http_posts:
+        _wait_for_posts(http_posts)
+
+
+def _wait_for_posts(posts: list[Future[None]]) -> None:
+    """Wait (bounded) for webhook POSTs to finish and log any that failed.
+
+    Args:
+        posts: Futures returned by the destination clients.
+    """
+    done, not_done = wait(posts, timeout=DISPATCH_TIMEOUT_SECONDS)
+    if not_done:
+        LOGGER.warning(
+            "%d webhook POST(s) still running after %.0f seconds; continuing.",
+            len(not_done),
+            DISPATCH_TIMEOUT_SECONDS,
+        )
+    for post in done:
+        exc = post.exception()
+        if exc is not None:
+            LOGGER.error("Webhook POST raised unexpectedly: %s", exc, exc_info=exc)
+
+
+def _enqueue_rabbit(
+    rabbit_queue: RabbitQueue, payload: dict[str, Any], routing_key: str
+) -> None:
+    """Hand a payload to the RabbitMQ publisher thread without blocking.
+
+    Args:
+        rabbit_queue: Queue feeding the RabbitMQ publisher thread.
+        payload: The message body to publish.
+        routing_key: The routing key to publish with.
+    """
+    try:
+        rabbit_queue.put_nowait((payload, routing_key))
+    except queue.Full:
+        LOGGER.error(  # noqa: TRY400
+            "RabbitMQ publish queue is full (%d messages), dropping message.",
+            rabbit_queue.maxsize,
+        )
 
 
 # ---------------------------------------------------------------------------
 # Serial processing loop
 # ---------------------------------------------------------------------------
 
+# Delay bounds (seconds) for reopening the serial port after a failure
+SERIAL_RETRY_MIN_DELAY = 0.05
+SERIAL_RETRY_MAX_DELAY = 5.0
+# A port that stayed open at least this long is considered to have recovered
+SERIAL_STABLE_SECONDS = 60.0
+# Most bytes taken from the serial driver's receive buffer in one read
+SERIAL_READ_SIZE = 4096
+
+
+def _serial_lines(ser: Serial) -> Iterator[bytes | None]:
+    """Yield lines from the serial port, reading all buffered bytes at once.
+
+    Each read takes whatever the driver has already received (up to
+    `SERIAL_READ_SIZE` bytes), or blocks for one byte up to the port's timeout
+    when nothing is waiting, so a burst of lines costs one read instead of one
+    per line. Like `Serial.readline()`, a timeout yields the partial line read
+    so far; if there is none it yields `None`, so that a timeout can be told
+    apart from a blank line (which is yielded as `b""`).
+
+    This is done here rather than by wrapping the port in `io.BufferedReader`,
+    which asks the port for a whole buffer per read (blocking until the
+    timeout unless that much arrives) and treats the empty read on a timeout
+    as end-of-file.
+
+    Args:
+        ser: The open serial port.
+
+    Yields:
+        Lines without their trailing newline, or `None` on a read timeout with
+        no partial line pending.
+    """
+    pending = b""
+    while True:
+        chunk = ser.read(min(ser.in_waiting, SERIAL_READ_SIZE) or 1)
+        if not chunk:
+            yield pending or None
+            pending = b""
+            continue
+        *lines, pending = (pending + chunk).split(b"\n")
+        yield from lines
+
+
+# Delimit a News Feed message block; matched on the raw serial bytes
+ENDEC_START_TAG = b"<ENDECSTART>"
+ENDEC_END_TAG = b"<ENDECEND>"
+# Serial text is decoded once per message, just before it is dispatched
+SERIAL_ENCODING = "utf-8"
+
 
 def process_serial(  # pylint: disable=too-many-branches, too-many-statements
     cfg: Settings,
-    rabbitmq_publisher: RabbitMQPublisher | None,
+    rabbit_queue: RabbitQueue | None,
     healthcheck_publisher: RabbitMQPublisher | None = None,
+    *,
+    health_manager: HealthCheckManager | None = None,
+    stop_event: threading.Event | None = None,
+    webhook_clients: list[Webhook] | None = None,
+    discord_client: Discord | None = None,
+    groupme_client: GroupMe | None = None,
 ) -> None:
     """Main event loop for processing serial input.
 
     This function continuously reads from the serial port and processes
-    incoming News Feed messages.
+    incoming News Feed messages, until `stop_event` is set.
 
     Args:
         cfg: The runtime configuration object containing serial port information.
-        rabbitmq_publisher: Instance for RabbitMQ publishing.
+        rabbit_queue: Queue feeding the RabbitMQ publisher thread.
         healthcheck_publisher: Instance for health check publishing.
+        health_manager: Health check schedule, e.g. one that has already sent the
+            startup ping. A fresh one is used if omitted.
+        stop_event: Set to make the loop return, within about one serial read
+            timeout. Runs until interrupted if omitted.
+        webhook_clients: Long-lived clients for the generic webhook URLs.
+        discord_client: Long-lived Discord client, if Discord is configured.
+        groupme_client: Long-lived GroupMe client, if GroupMe is configured.
     """
-    # Initialize health check manager
-    health_manager = HealthCheckManager()
+    from serial import Serial
+    from serial.serialutil import SerialException
 
-    def transform_and_send(lines: list[str]) -> None:  # pylint: disable=too-many-locals
+    if health_manager is None:
+        health_manager = HealthCheckManager()
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    def transform_and_send(  # pylint: disable=too-many-locals
+        lines: list[bytes],
+    ) -> None:
         """Transform incoming lines into a message and send to configured destinations.
 
-        Uses two attempts to find a valid EAS header and message body with different
-        regex patterns.
+        The lines are joined without separators and searched once for an EAS
+        header, which finds headers that fill a line as well as ones fragmented
+        across lines or embedded in other text. Everything around the header is
+        the message body. Matching runs on the raw bytes; only the header and
+        the final message body are decoded.
 
         Args:
-            lines: The list of lines read from the serial port.
+            lines: The list of raw lines read from the serial port.
         """
         eas_fields: dict[str, Any] = {}
-        final_message_str: str = ""
 
         cleaned_lines = [line.strip() for line in lines if line.strip()]
         if not cleaned_lines:
             LOGGER.debug("No content in buffer to send after cleaning.")
             return
 
-        # Attempt 1: Check for a complete header on a single line
-        found_header_on_single_line = False
-        single_line_header_index = -1
+        # Join without spaces so a header split across lines is reassembled
+        content_for_header_search = b"".join(cleaned_lines)
+        header_match = HEADER_SEARCH_RE_B.search(content_for_header_search)
+        # The message body keeps the original line breaks as spaces
+        spaced_content = b" ".join(cleaned_lines)
 
-        for i, line in enumerate(cleaned_lines):
-            if HEADER_RE.match(line):  # Strict match for the whole line
-                try:
-                    potential_eas_fields = parse_eas(line, cfg.timezone)
-                    eas_fields = potential_eas_fields  # Parsed successfully
-                    single_line_header_index = i
-                    found_header_on_single_line = True
-                    LOGGER.debug(
-                        "Attempt 1: Found and parsed complete EAS header on line %d: "
-                        "%s",
-                        i,
-                        line,
-                    )
-                    break
-                except ValueError:
-                    # Line looked like a header but failed full validation
-                    LOGGER.debug(
-                        "Attempt 1: Line %s seemed like a header but failed parse_eas.",
-                        line,
-                    )
-                    continue  # Keep checking other lines
-
-        if found_header_on_single_line:  # pylint: disable=too-many-nested-blocks
-            message_body_lines = [
-                line
-                for idx, line in enumerate(cleaned_lines)
-                if idx != single_line_header_index
-            ]
-            final_message_str = " ".join(message_body_lines).strip()
-        else:
-            # Attempt 2: Header might be fragmented or embedded; search in concatenated
-            # content
-            LOGGER.debug(
-                "Attempt 1 failed. Proceeding to Attempt 2 (concatenated search for "
-                "fragmented/embedded header)."
-            )
-            content_for_header_search = "".join(
-                cleaned_lines
-            )  # Join without spaces for header reconstruction
-
-            header_match_in_joined = HEADER_SEARCH_RE.search(content_for_header_search)
-
-            if header_match_in_joined:
-                candidate_header_str = header_match_in_joined.group(0)
-                try:
-                    eas_fields = parse_eas(candidate_header_str, cfg.timezone)
-                    LOGGER.debug(
-                        "Attempt 2: Found + parsed EAS header from joined content: %s",
-                        eas_fields.get("event_name", candidate_header_str),
-                    )
-
-                    # The header was found in `content_for_header_search` at
-                    # `header_match_in_joined.span()`.
-                    # We need to iterate through `cleaned_lines` and pick out the parts
-                    # that are NOT part of the header.
-
-                    match_span_in_concat = (
-                        header_match_in_joined.span()
-                    )  # (start_char_idx, end_char_idx) of header in concatenated string
-
-                    message_fragments = []
-                    current_concat_pos = 0
-                    for original_line in cleaned_lines:
-                        line_len = len(original_line)
-                        line_concat_start = current_concat_pos
-                        line_concat_end = current_concat_pos + line_len
-
-                        # Determine parts of original_line to keep based on its position
-                        # relative to the header's span in the concatenated string.
-
-                        # Part of the line that falls BEFORE the header match segment
-                        if line_concat_start < match_span_in_concat[0]:
-                            # End of this pre-header segment is the earlier of line_end
-                            # or header_start
-                            actual_end_for_pre_segment = min(
-                                line_concat_end, match_span_in_concat[0]
-                            )
-                            num_chars_in_pre_segment = (
-                                actual_end_for_pre_segment - line_concat_start
-                            )
-                            if num_chars_in_pre_segment > 0:
-                                message_fragments.append(
-                                    original_line[:num_chars_in_pre_segment]
-                                )
-
-                        # Part of the line that falls AFTER the header match segment
-                        if line_concat_end > match_span_in_concat[1]:
-                            # Start of this post-header segment is the later of
-                            # line_start or header_end
-                            actual_start_for_post_segment = max(
-                                line_concat_start, match_span_in_concat[1]
-                            )
-                            num_chars_in_post_segment = (
-                                line_concat_end - actual_start_for_post_segment
-                            )
-                            if num_chars_in_post_segment > 0:
-                                # Calculate slice start offset relative to the current
-                                # original_line
-                                slice_start_offset = (
-                                    actual_start_for_post_segment - line_concat_start
-                                )
-                                message_fragments.append(
-                                    original_line[slice_start_offset:]
-                                )
-
-                        current_concat_pos = line_concat_end
-
-                    # Join the collected fragments with spaces.
-                    # Filter out any fragments that might have become empty.
-                    final_message_str = " ".join(
-                        frag for frag in message_fragments if frag
-                    ).strip()
-
-                    LOGGER.debug(
-                        "Attempt 2: Reconstructed message body from original lines "
-                        "(excluding header): `%.200s`",
-                        final_message_str,
-                    )
-
-                except ValueError:
-                    LOGGER.warning(
-                        "Attempt 2: String `%s` found by search did not validate as EAS"
-                        " header. Treating all lines as message.",
-                        candidate_header_str,
-                    )
-                    # Fallback: No valid header found, treat all original lines as
-                    # message with spaces
-                    final_message_str = " ".join(cleaned_lines).strip()
-                    eas_fields = {}  # Ensure it's empty
+        if header_match:
+            candidate_header_str = header_match.group(0).decode("ascii")
+            try:
+                eas_fields = parse_eas(candidate_header_str, cfg.timezone)
+            except ValueError:
+                LOGGER.warning(
+                    "String `%s` found by search did not validate as EAS header. "
+                    "Treating all lines as message.",
+                    candidate_header_str,
+                )
             else:
-                # No header found by either method
                 LOGGER.debug(
-                    "Attempt 2: No EAS header pattern found in joined content."
+                    "Found + parsed EAS header: %s",
+                    eas_fields.get("event_name", candidate_header_str),
                 )
-                final_message_str = " ".join(cleaned_lines).strip()
-                eas_fields = {}
+
+                # Shift the header's span from the no-space join into
+                # `spaced_content` by one per line boundary before each end,
+                # then cut it out
+                line_starts = [0, *accumulate(map(len, cleaned_lines[:-1]))]
+                header_start, header_end = header_match.span()
+                header_start += bisect_right(line_starts, header_start) - 1
+                header_end += bisect_right(line_starts, header_end) - 1
+                spaced_content = b" ".join(
+                    frag
+                    for frag in (
+                        spaced_content[:header_start].strip(),
+                        spaced_content[header_end:].strip(),
+                    )
+                    if frag
+                )
+        else:
+            LOGGER.debug("No EAS header pattern found in buffered content.")
+
+        final_message_str = spaced_content.decode(
+            SERIAL_ENCODING, errors="ignore"
+        ).strip()
+        LOGGER.debug("Message body (excluding header): `%.200s`", final_message_str)
 
         # Fallback message if parsing yielded EAS fields but no actual message body text
         # was derived
@@ -1420,23 +2222,34 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
             eas_fields.get("event_name", "No EAS Header"),
             final_message_str[:100],
         )
-        dispatch(final_message_str, eas_fields, cfg, rabbitmq_publisher)
+        dispatch(
+            final_message_str,
+            eas_fields,
+            cfg,
+            rabbit_queue,
+            webhook_clients=webhook_clients,
+            discord_client=discord_client,
+            groupme_client=groupme_client,
+        )
 
-    while True:  # pylint: disable=too-many-nested-blocks
+    backoff = SERIAL_RETRY_MIN_DELAY
+    while not stop_event.is_set():  # pylint: disable=too-many-nested-blocks
         ser: Serial | None = None
+        opened_at: float | None = None
         try:
             LOGGER.debug("Opening serial port `%s` at 9600 baud.", cfg.port)
             ser = Serial(cfg.port, baudrate=9600, bytesize=8, stopbits=1, timeout=1)
+            opened_at = time.monotonic()
             LOGGER.info("Serial port `%s` opened.", cfg.port)
 
-            buffer: list[str] = []
+            buffer: list[bytes] = []
             in_message_block = False
+            serial_lines = _serial_lines(ser)
 
-            while ser.is_open:
-                raw_bytes = b""
+            while ser.is_open and not stop_event.is_set():
                 try:
-                    raw_bytes = ser.readline()
-                    if not raw_bytes:  # Timeout occurred, loop again
+                    raw_bytes = next(serial_lines)
+                    if raw_bytes is None:  # Timeout occurred, loop again
                         # Send health check during timeout periods (but only if it's
                         # time)
                         if health_manager.should_send_health_check():
@@ -1450,19 +2263,21 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
                             in_message_block
                         ):  # If we were in a block, maybe it ended due to timeout
                             LOGGER.debug(
-                                "Serial readline timed out while in message block. "
+                                "Serial read timed out while in message block. "
                                 "Processing buffered lines."
                             )
                             if buffer:
-                                transform_and_send(list(buffer))  # Send copy
-                                buffer.clear()
+                                # Hand the list off and start a fresh one
+                                current, buffer = buffer, []
+                                transform_and_send(current)
                             in_message_block = False
                         continue
 
-                    line = raw_bytes.decode("utf-8", errors="ignore").strip()
+                    line = raw_bytes.strip()
                     LOGGER.debug("Raw serial line: %r", line)
 
-                    if "<ENDECSTART>" in line:
+                    _, start_tag, after_start = line.partition(ENDEC_START_TAG)
+                    if start_tag:
                         LOGGER.debug("Found <ENDECSTART>. Starting new message block.")
                         if buffer:
                             # Process any previous dangling buffer lines if a new START
@@ -1471,31 +2286,28 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
                                 "New <ENDECSTART> found with existing buffer. "
                                 "Processing old buffer first."
                             )
-                            transform_and_send(list(buffer))
-                        buffer.clear()
+                            current, buffer = buffer, []
+                            transform_and_send(current)
                         in_message_block = True
 
                         # Remove the tag itself if it's the only thing on the line
-                        line_content_after_start = line.split("<ENDECSTART>", 1)[
-                            -1
-                        ].strip()
+                        line_content_after_start = after_start.strip()
                         if line_content_after_start:
                             buffer.append(line_content_after_start)
-                        continue  # Move to next readline
+                        continue  # Move to next line
 
                     if in_message_block:
-                        if "<ENDECEND>" in line:
+                        before_end, end_tag, _ = line.partition(ENDEC_END_TAG)
+                        if end_tag:
                             LOGGER.debug("Found <ENDECEND>. Ending message block.")
                             # Content before <ENDECEND> on the same line
-                            line_content_before_end = line.split("<ENDECEND>", 1)[
-                                0
-                            ].strip()
+                            line_content_before_end = before_end.strip()
                             if line_content_before_end:
                                 buffer.append(line_content_before_end)
 
                             if buffer:
-                                transform_and_send(list(buffer))
-                            buffer.clear()
+                                current, buffer = buffer, []
+                                transform_and_send(current)
                             in_message_block = False
                         elif line:  # Add non-empty lines to buffer
                             buffer.append(line)
@@ -1508,12 +2320,6 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
                     # Might indicate a disconnected device, break to outer loop to retry
                     # connection
                     break
-                except UnicodeDecodeError as decode_exc:
-                    LOGGER.warning(
-                        "Unicode decode error for raw bytes: %r - %s",
-                        raw_bytes,
-                        decode_exc,
-                    )
         except SerialException as conn_exc:
             LOGGER.exception(
                 "Failed to open or communicate with serial port `%s`: %s",
@@ -1528,19 +2334,25 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
             if ser and ser.is_open:
                 ser.close()
 
-            if (
-                rabbitmq_publisher
-            ):  # Check connection periodically if RabbitMQ is enabled
-                try:
-                    rabbitmq_publisher.ensure_connection()
-                except Exception:  # pylint: disable=broad-except
-                    LOGGER.exception("Periodic RabbitMQ connection check failed")
-
-            LOGGER.info(
-                "Waiting 5 seconds before retrying serial processing loop due to a "
-                "failure..."
-            )
-            time.sleep(5)
+            if stop_event.is_set():
+                LOGGER.info("Serial processing loop stopped.")
+            else:
+                # Reset the backoff only if the port was healthy for a while, so a
+                # device that opens but fails immediately doesn't busy-loop
+                if (
+                    opened_at is not None
+                    and time.monotonic() - opened_at >= SERIAL_STABLE_SECONDS
+                ):
+                    backoff = SERIAL_RETRY_MIN_DELAY
+
+                delay = backoff + random.random() * SERIAL_RETRY_MIN_DELAY  # noqa: S311
+                LOGGER.info(
+                    "Waiting %.2f seconds before retrying serial processing loop "
+                    "due to a failure...",
+                    delay,
+                )
+                stop_event.wait(delay)  # Cut short by a shutdown request
+                backoff = min(backoff * 2, SERIAL_RETRY_MAX_DELAY)
 
 
 # ---------------------------------------------------------------------------
@@ -1548,6 +2360,47 @@ def process_serial(  # pylint: disable=too-many-branches, too-many-statements
 # ---------------------------------------------------------------------------
 
 
+def _init_publisher(
+    connection: SharedAMQPConnection,
+    exchange_name: str,
+    routing_key: str,
+    label: str,
+) -> RabbitMQPublisher | None:
+    """Create a publisher on the shared connection, logging the outcome.
+
+    A publisher that fails to initialize is logged and skipped, so the
+    application keeps running without it.
+
+    Args:
+        connection: The shared AMQP connection to open a channel on.
+        exchange_name: Name of the exchange to publish to.
+        routing_key: Routing key the publisher will be used with (for logging).
+        label: What the publisher is for, e.g. "alert" or "health check".
+
+    Returns:
+        The publisher, or None if it could not be initialized.
+    """
+    try:
+        publisher = RabbitMQPublisher(
+            exchange_name=exchange_name, connection=connection
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        LOGGER.exception(
+            "Failed to initialize RabbitMQ %s publisher: `%s`. Will proceed "
+            "without it.",
+            label,
+            e,
+        )
+        return None
+    LOGGER.info(
+        "RabbitMQ %s publisher initialized for exchange `%s` (routing key: `%s`).",
+        label,
+        exchange_name,
+        routing_key,
+    )
+    return publisher
+
+
 def main() -> None:  # pylint: disable=too-many-statements
     """Main entry point for the WBOR ENDEC decoder and publisher application."""
     # Get public config
@@ -1561,128 +2414,145 @@ def main() -> None:  # pylint: disable=too-many-statements
     secrets: dict[str, Any] = {}
     cfg: Settings | None = None
     rabbitmq_publisher: RabbitMQPublisher | None = None
+    healthcheck_publisher: RabbitMQPublisher | None = None
+    amqp_connection: SharedAMQPConnection | None = None
+    rabbit_queue: RabbitQueue | None = None
+    rabbit_thread: threading.Thread | None = None
 
     try:
         public_cfg = _load_json(args.config)
 
-        # Get secrets, assuming they live at a fixed path
-        secret_path_str = os.getenv("SECRETS_PATH", "/etc/wbor-endec/secrets.json")
-        secret_path = Path(secret_path_str)
-        if not secret_path.exists():
-            LOGGER.error(
-                "Secrets file not found at %s. Please create it or set SECRETS_PATH.",
-                secret_path,
-            )
-            # No point in continuing if secrets can't be loaded for URLs etc.
-            # However, if RabbitMQ URL is also in public_cfg or env vars, this logic
-            # might change.
-            # For now, assuming `secrets.json` is critical.
-            # Try to setup basic logging even if we exit early.
-            _lazy_setup_logging(
-                public_cfg.get("debug", False), public_cfg.get("logfile")
-            )
-            return
+        # Get secrets, assuming they live at a fixed path. No point in continuing
+        # if they can't be loaded, so a missing file is fatal like the config's
+        secret_path = Path(os.getenv("SECRETS_PATH", "/etc/wbor-endec/secrets.json"))
         secrets = _load_json(secret_path)
 
         cfg = Settings(public_cfg, secrets)
         _lazy_setup_logging(cfg.debug, cfg.logfile)  # Setup logging using settings
 
-    except FileNotFoundError as e:
-        # Basic logging setup if config/secrets loading fails early
-        _lazy_setup_logging(public_cfg.get("debug", False), public_cfg.get("logfile"))
-        LOGGER.critical("Configuration file not found: %s. Exiting.", e)
-        return
-    except json.JSONDecodeError as e:
-        _lazy_setup_logging(public_cfg.get("debug", False), public_cfg.get("logfile"))
-        LOGGER.critical("Error decoding JSON configuration: %s. Exiting.", e)
-        return
-    except RuntimeError as e:  # For "No destinations configured"
-        _lazy_setup_logging(public_cfg.get("debug", False), public_cfg.get("logfile"))
-        LOGGER.critical("Configuration error: %s. Exiting.", e)
-        return
     except Exception as e:  # pylint: disable=broad-except
+        # Basic logging setup, from whatever config loaded, to report the failure
         _lazy_setup_logging(public_cfg.get("debug", False), public_cfg.get("logfile"))
-        LOGGER.critical(
-            "An unexpected error occurred during initialization: %s", e, exc_info=True
-        )
+        if isinstance(e, FileNotFoundError):
+            LOGGER.critical(
+                "Configuration file not found: %s. Create it (or set SECRETS_PATH "
+                "for the secrets file). Exiting.",
+                e,
+            )
+        elif isinstance(e, json.JSONDecodeError):
+            LOGGER.critical("Error decoding JSON configuration: %s. Exiting.", e)
+        elif isinstance(e, RuntimeError):  # For "No destinations configured"
+            LOGGER.critical("Configuration error: %s. Exiting.", e)
+        else:
+            LOGGER.critical(
+                "An unexpected error occurred during initialization: %s",
+                e,
+                exc_info=True,
+            )
         return
 
     LOGGER.info("wbor-endec starting on serial port `%s`", cfg.port)
 
-    # Initialize RabbitMQ Publisher if configured
-    if cfg.rabbitmq_amqp_url and cfg.rabbitmq_exchange_name:
-        try:
-            rabbitmq_publisher = RabbitMQPublisher(
-                amqp_url=cfg.rabbitmq_amqp_url, exchange_name=cfg.rabbitmq_exchange_name
-            )
-            LOGGER.info(
-                "RabbitMQ publisher initialized for exchange `%s` (routing key: `%s`).",
-                cfg.rabbitmq_exchange_name,
-                cfg.rabbitmq_routing_key,
-            )
-        except Exception as e:  # pylint: disable=broad-except
-            LOGGER.exception(
-                "Failed to initialize RabbitMQ publisher: `%s`. Will proceed without "
-                "RabbitMQ.",
-                e,
-            )
-            rabbitmq_publisher = None  # Ensure it's None if init fails
-    elif cfg.rabbitmq_amqp_url and not cfg.rabbitmq_exchange_name:
-        LOGGER.error(
-            "RabbitMQ AMQP URL provided but exchange name is missing. "
-            "RabbitMQ disabled."
+    # Everything opened from here on is closed in reverse order on the way out,
+    # however main() exits
+    with ExitStack() as cleanup:
+        # Build destination clients once so they are reused for every alert, all
+        # sharing one pooled HTTP session (one keep-alive connection per host)
+        http_session = _build_http_session()
+        cleanup.callback(_DISPATCH_EXECUTOR.shutdown, wait=False)
+        cleanup.callback(http_session.close)
+        webhook_clients = [Webhook(url, http_session) for url in cfg.webhooks]
+        discord_client = (
+            Discord(cfg.discord_urls, http_session) if cfg.discord_urls else None
+        )
+        groupme_client = (
+            GroupMe(cfg.groupme_bot_ids, http_session) if cfg.groupme_bot_ids else None
         )
 
-    # Initialize RabbitMQ Health Check Publisher if configured
-    healthcheck_publisher: RabbitMQPublisher | None = None
-    if cfg.rabbitmq_amqp_url and cfg.rabbitmq_healthcheck_exchange:
-        try:
-            healthcheck_publisher = RabbitMQPublisher(
-                amqp_url=cfg.rabbitmq_amqp_url,
-                exchange_name=cfg.rabbitmq_healthcheck_exchange,
+        # Both publishers open their channels on one shared AMQP connection
+        if cfg.rabbitmq_amqp_url:
+            amqp_connection = SharedAMQPConnection(cfg.rabbitmq_amqp_url)
+            if cfg.rabbitmq_exchange_name:
+                rabbitmq_publisher = _init_publisher(
+                    amqp_connection,
+                    cfg.rabbitmq_exchange_name,
+                    cfg.rabbitmq_routing_key,
+                    "alert",
+                )
+                if rabbitmq_publisher:
+                    cleanup.callback(rabbitmq_publisher.close)
+            if cfg.rabbitmq_healthcheck_exchange:
+                healthcheck_publisher = _init_publisher(
+                    amqp_connection,
+                    cfg.rabbitmq_healthcheck_exchange,
+                    cfg.rabbitmq_healthcheck_routing_key,
+                    "health check",
+                )
+                if healthcheck_publisher:
+                    cleanup.callback(healthcheck_publisher.close)
+
+        if rabbitmq_publisher:
+            rabbit_queue = queue.Queue(maxsize=RABBIT_QUEUE_MAXSIZE)
+            rabbit_thread = threading.Thread(
+                target=_rabbit_worker,
+                args=(rabbitmq_publisher, rabbit_queue),
+                name="wbor-endec-rabbitmq",
+                daemon=True,
             )
-            LOGGER.info(
-                "RabbitMQ health check publisher initialized for exchange `%s` "
-                "(routing key: `%s`).",
-                cfg.rabbitmq_healthcheck_exchange,
-                cfg.rabbitmq_healthcheck_routing_key,
+            rabbit_thread.start()
+            # Drains the queue before (LIFO) the publisher's close() above runs
+            cleanup.callback(_stop_rabbit_worker, rabbit_queue, rabbit_thread)
+
+        # One manager for the whole run, so the serial loop's hourly schedule counts
+        # from the startup ping, which is sent in the background
+        health_manager = HealthCheckManager()
+        if healthcheck_publisher:
+            health_manager.send_startup_health_check(
+                healthcheck_publisher, cfg.rabbitmq_healthcheck_routing_key, cfg.port
             )
-        except Exception as e:  # pylint: disable=broad-except
-            LOGGER.exception(
-                "Failed to initialize RabbitMQ health check publisher: `%s`. "
-                "Will proceed without health check publishing.",
-                e,
+
+        # SIGTERM (e.g. systemd stop) and Ctrl-C ask the serial loop to return, so
+        # the registered cleanup always runs and the broker sees clean closes.
+        # The handler only sets the event; logging isn't safe in signal handlers.
+        # The previous handlers are put back during cleanup
+        stop_event = threading.Event()
+
+        def _request_stop(_signum: int, _frame: object) -> None:
+            stop_event.set()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous_handler = signal.signal(signum, _request_stop)
+            # None means the handler wasn't installed from Python; use the default
+            cleanup.callback(
+                signal.signal,
+                signum,
+                signal.SIG_DFL if previous_handler is None else previous_handler,
             )
-            healthcheck_publisher = None
-
-    # Send startup health check ping if health check publisher is available
-    if healthcheck_publisher:
-        startup_health_manager = HealthCheckManager()
-        # Force a startup health check by setting last time to None, which will make
-        # should_send_health_check return True
-        if startup_health_manager.should_send_health_check():
-            startup_health_manager.send_health_check(
+
+        # Runs first on the way out, before the cleanup registered above
+        cleanup.callback(LOGGER.info, "wbor-endec shutting down...")
+
+        try:
+            process_serial(
+                cfg,
+                rabbit_queue,
                 healthcheck_publisher,
-                cfg.rabbitmq_healthcheck_routing_key,
-                cfg.port,
+                health_manager=health_manager,
+                stop_event=stop_event,
+                webhook_clients=webhook_clients,
+                discord_client=discord_client,
+                groupme_client=groupme_client,
             )
-            LOGGER.info("Startup health check ping sent")
-
-    try:
-        process_serial(cfg, rabbitmq_publisher, healthcheck_publisher)
-    except KeyboardInterrupt:
-        LOGGER.info("Keyboard interrupt received. Shutting down...")
-    except (
-        Exception  # pylint: disable=broad-exception-caught
-    ) as e:
-        # Catch unexpected errors from process_serial if they escape its own try/except
-        LOGGER.critical("Critical error in main processing: %s", e, exc_info=True)
-    finally:
-        LOGGER.info("wbor-endec shutting down...")
-        if rabbitmq_publisher:
-            rabbitmq_publisher.close()
-        if healthcheck_publisher:
-            healthcheck_publisher.close()
+            if stop_event.is_set():
+                LOGGER.info("Stop signal received. Shutting down...")
+        except KeyboardInterrupt:  # Only if raised before the handlers took over
+            LOGGER.info("Keyboard interrupt received. Shutting down...")
+        except (
+            Exception  # pylint: disable=broad-exception-caught
+        ) as e:
+            # Catch unexpected errors from process_serial if they escape its own
+            # try/except
+            LOGGER.critical("Critical error in main processing: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -121,7 +121,7 @@ class HealthCheckMonitor:
         self,
         ch: pika.channel.Channel,  # type: ignore[attr-defined]
         method: pika.spec.Basic.Deliver,  # type: ignore[attr-defined]
-        _properties: pika.spec.BasicProperties,  # type: ignore[attr-defined]
+        properties: pika.spec.BasicProperties,  # type: ignore[attr-defined]
         body: bytes,
     ) -> None:
         """Process incoming health check messages from RabbitMQ.
@@ -129,7 +129,7 @@ class HealthCheckMonitor:
         Args:
             ch: The channel object.
             method: Delivery method containing delivery information.
-            _properties: Message properties (unused).
+            properties: Message properties; the AMQP headers identify the sender.
             body: The message body as bytes.
         """
         try:
@@ -143,9 +143,10 @@ class HealthCheckMonitor:
             # Log with local timezone for readability
             local_time = self.last_health_check.astimezone(self.timezone)
             logger.info(
-                "Received health check at %s (%s): %s",
+                "Received health check at %s (%s): %s %s",
                 local_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
                 self.timezone_str,
+                properties.headers,
                 message,
             )
             ch.basic_ack(delivery_tag=method.delivery_tag)